@@ -5,6 +5,8 @@ import fs from "fs/promises";
 import path from "path";
 import { fileURLToPath } from "url";
 import crypto from "crypto";
+import http from "http";
+import https from "https";
 import WebSocket from "ws";
 import fetch from "node-fetch";
 
@@ -32,7 +34,16 @@ const {
   OPENAI_AGENT_ID,
   OPENAI_MODEL,
   OPENAI_TEMPERATURE = "0.7",
-  OPENAI_MAX_TOKENS = "512"
+  OPENAI_MAX_TOKENS = "512",
+  AGENT_STREAMING = "false",
+  STREAM_CHUNK_CHARS = "400",
+  STREAM_FLUSH_MS = "1500",
+  EMBEDDING_API_URL,
+  EMBEDDING_API_KEY,
+  EMBEDDING_MODEL = "nomic-embed-text",
+  SEMANTIC_CACHE_TTL = "3600",
+  SEMANTIC_CACHE_MAX_DISTANCE = "0.1",
+  SEMANTIC_CACHE_MAX_ENTRIES = "512"
 } = process.env;
 
 const POLL_INTERVAL_MS = Math.max(500, Number(TELEGRAM_POLL_INTERVAL) * 1000 || 2000);
@@ -44,6 +55,47 @@ const STATE_PATH = path.isAbsolute(TELEGRAM_STATE_FILE)
 const AI_PREFIXES = ["/ai", "!ai", ".ai", "/askai", "/gpt"];
 const AI_PHRASES = ["ai:", "ask ai", "ask the ai", "dear ai", "gpt", "assistant please"];
 
+function escapeRegExp(text) {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+}
+
+// Compiled once: one sweep for phrases instead of indexOf per pattern.
+const AI_PHRASE_RE = new RegExp(AI_PHRASES.map(escapeRegExp).join("|"));
+
+// Prefixes bucketed by length: one Set lookup per distinct length beats
+// an alternation walk when most traffic is non-AI chatter.
+const AI_PREFIX_BUCKETS = [...new Set(AI_PREFIXES.map((p) => p.length))]
+  .sort((a, b) => a - b)
+  .map((length) => [
+    length,
+    new Set(AI_PREFIXES.filter((p) => p.length === length))
+  ]);
+
+// First characters of every prefix/phrase (both cases). Most Telegram
+// chatter contains none of them, so one cheap scan skips the
+// trim/lowercase/match pipeline entirely.
+const MARKER_CHARS = new Set();
+for (const pattern of [...AI_PREFIXES, ...AI_PHRASES]) {
+  MARKER_CHARS.add(pattern[0]);
+  MARKER_CHARS.add(pattern[0].toUpperCase());
+}
+
+function mayContainAiMarker(text) {
+  for (let i = 0; i < text.length; i += 1) {
+    if (MARKER_CHARS.has(text[i])) return true;
+  }
+  return false;
+}
+
+function matchPrefix(lowered) {
+  for (const [length, bucket] of AI_PREFIX_BUCKETS) {
+    if (lowered.length >= length && bucket.has(lowered.slice(0, length))) {
+      return length;
+    }
+  }
+  return 0;
+}
+
 const logger = new console.Console(process.stdout, process.stderr);
 
 async function ensureDir(filePath) {
@@ -51,16 +103,22 @@ async function ensureDir(filePath) {
   await fs.mkdir(dir, { recursive: true });
 }
 
+const STATE_SAVE_MIN_INTERVAL_MS = 5000;
+
 class StateStore {
   constructor(filePath) {
     this.filePath = filePath;
+    this.lastSavedId = null;
+    this.lastSaveTs = 0;
   }
 
   async load() {
     try {
       const data = await fs.readFile(this.filePath, "utf8");
       const parsed = JSON.parse(data);
-      return { lastUpdateId: Number(parsed.lastUpdateId) || 0 };
+      const state = { lastUpdateId: Number(parsed.lastUpdateId) || 0 };
+      this.lastSavedId = state.lastUpdateId;
+      return state;
     } catch (err) {
       if (err.code !== "ENOENT") {
         logger.warn("[TelegramWorker] Failed to load state:", err);
@@ -72,8 +130,26 @@ class StateStore {
   async save(state) {
     await ensureDir(this.filePath);
     const tmp = `${this.filePath}.tmp`;
-    await fs.writeFile(tmp, JSON.stringify(state, null, 2), "utf8");
+    // fsync before the atomic rename so a crash can't leave a truncated
+    // state file behind.
+    const handle = await fs.open(tmp, "w");
+    try {
+      await handle.writeFile(JSON.stringify(state, null, 2), "utf8");
+      await handle.sync();
+    } finally {
+      await handle.close();
+    }
     await fs.rename(tmp, this.filePath);
+    this.lastSavedId = state.lastUpdateId;
+    this.lastSaveTs = Date.now();
+  }
+
+  // Busy cycles would otherwise rewrite the file thousands of times a
+  // day; only persist when the id moved and at most every few seconds.
+  async saveIfDirty(state) {
+    if (state.lastUpdateId === this.lastSavedId) return;
+    if (Date.now() - this.lastSaveTs < STATE_SAVE_MIN_INTERVAL_MS) return;
+    await this.save(state);
   }
 }
 
@@ -81,90 +157,196 @@ function delay(ms) {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
-function randomId() {
-  return crypto.randomBytes(8).toString("hex");
+// One process-wide keep-alive agent pair: every client shares the same
+// connection pool and TLS session cache, so resumed handshakes carry
+// across clients and cold connections stay cheap.
+const SHARED_HTTP_AGENT = new http.Agent({ keepAlive: true, maxSockets: 32 });
+const SHARED_HTTPS_AGENT = new https.Agent({
+  keepAlive: true,
+  maxSockets: 32,
+  maxCachedSessions: 100
+});
+
+function selectSharedAgent(parsedUrl) {
+  return parsedUrl.protocol === "http:" ? SHARED_HTTP_AGENT : SHARED_HTTPS_AGENT;
 }
 
+// The initialize frame never varies, and "init" is unique within a
+// connection, so the envelope is serialized exactly once per process.
+const MCP_INIT_ID = "init";
+const MCP_INIT_FRAME = JSON.stringify({
+  jsonrpc: "2.0",
+  id: MCP_INIT_ID,
+  method: "initialize"
+});
+const MCP_INBOX_PARAMS = Object.freeze({ uri: "resource://telegram.inbox" });
+
 class McpClient {
   constructor(endpoint) {
     this.endpoint = endpoint;
+    this.ws = null;
+    this.connectPromise = null;
+    this.pending = new Map();
+    this.serverInfo = null;
+    this.capabilities = null;
+    // JSON-RPC ids only need per-connection uniqueness; a counter avoids
+    // a randomBytes syscall per request. Never collides with "init".
+    this.nextId = 1;
   }
 
-  async rpc(method, params = {}) {
-    return new Promise((resolve, reject) => {
+  _nextRequestId() {
+    return String(this.nextId++);
+  }
+
+  _resetConnection(err) {
+    const pending = this.pending;
+    this.pending = new Map();
+    this.ws = null;
+    this.connectPromise = null;
+    for (const entry of pending.values()) {
+      entry.reject(err || new Error("MCP connection lost."));
+    }
+  }
+
+  // Keep one long-lived websocket and multiplex requests by id instead of
+  // paying a TCP handshake plus MCP initialize for every RPC.
+  _ensureConnected() {
+    if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+      return Promise.resolve(this.ws);
+    }
+    if (this.connectPromise) {
+      return this.connectPromise;
+    }
+
+    this.connectPromise = new Promise((resolve, reject) => {
       const ws = new WebSocket(this.endpoint, { handshakeTimeout: 10000 });
-      const initId = randomId();
-      let requestId = null;
-      let stage = "init";
-      let settled = false;
-
-      const cleanup = (err, result) => {
-        if (settled) return;
-        settled = true;
-        try {
-          if (ws.readyState === WebSocket.OPEN || ws.readyState === WebSocket.CONNECTING) {
-            ws.close();
-          }
-        } catch (_) {
-          // ignore
-        }
-        if (err) reject(err);
-        else resolve(result);
-      };
+      let initialized = false;
 
       ws.on("open", () => {
-        ws.send(JSON.stringify({ jsonrpc: "2.0", id: initId, method: "initialize" }));
+        ws.send(MCP_INIT_FRAME);
       });
 
+      const dispatch = (payload) => {
+        if (!payload || !("id" in payload)) {
+          return; // notification
+        }
+
+        if (!initialized && payload.id === MCP_INIT_ID) {
+          if (payload.error) {
+            this.connectPromise = null;
+            try {
+              ws.close();
+            } catch (_) {
+              // ignore
+            }
+            reject(new Error(`MCP initialize error: ${payload.error.message || "unknown"}`));
+            return;
+          }
+          initialized = true;
+          // Cache the handshake result for the connection lifetime; no
+          // further initialize round-trips happen on this socket.
+          this.serverInfo = payload.result?.serverInfo || null;
+          this.capabilities = payload.result?.capabilities || null;
+          this.ws = ws;
+          resolve(ws);
+          return;
+        }
+
+        const entry = this.pending.get(payload.id);
+        if (!entry) {
+          return; // unrelated response
+        }
+        this.pending.delete(payload.id);
+        if (payload.error) {
+          entry.reject(new Error(`MCP error (${payload.error.code}): ${payload.error.message}`));
+        } else {
+          entry.resolve(payload.result || {});
+        }
+      };
+
       ws.on("message", (data) => {
         let payload;
         try {
           payload = JSON.parse(data.toString());
         } catch (err) {
-          cleanup(new Error(`Invalid JSON from MCP: ${data}`));
+          logger.error("[TelegramWorker] Invalid JSON from MCP:", data.toString());
           return;
         }
 
-        if (!("id" in payload)) {
-          return; // notification
+        if (Array.isArray(payload)) {
+          payload.forEach(dispatch);
+        } else {
+          dispatch(payload);
         }
+      });
 
-        if (stage === "init" && payload.id === initId) {
-          if (payload.error) {
-            cleanup(new Error(`MCP initialize error: ${payload.error.message || "unknown"}`));
-            return;
-          }
-          stage = "request";
-          requestId = randomId();
-          ws.send(
-            JSON.stringify({
-              jsonrpc: "2.0",
-              id: requestId,
-              method,
-              params
-            })
-          );
-          return;
+      ws.on("error", (err) => {
+        if (!initialized) {
+          this.connectPromise = null;
+          reject(err);
         }
+        this._resetConnection(err);
+      });
 
-        if (stage === "request" && payload.id === requestId) {
-          if (payload.error) {
-            cleanup(new Error(`MCP error (${payload.error.code}): ${payload.error.message}`));
-            return;
-          }
-          cleanup(null, payload.result || {});
+      ws.on("close", () => {
+        if (!initialized) {
+          this.connectPromise = null;
+          reject(new Error("MCP connection closed during initialize."));
         }
+        this._resetConnection(new Error("MCP connection closed before response was received."));
       });
+    });
 
-      ws.on("error", (err) => cleanup(err));
-      ws.on("close", () => {
-        if (!settled) cleanup(new Error("MCP connection closed before response was received."));
+    return this.connectPromise;
+  }
+
+  async rpc(method, params = {}) {
+    const ws = await this._ensureConnected();
+    const requestId = this._nextRequestId();
+    return new Promise((resolve, reject) => {
+      this.pending.set(requestId, { resolve, reject });
+      ws.send(JSON.stringify({ jsonrpc: "2.0", id: requestId, method, params }), (err) => {
+        if (err) {
+          this.pending.delete(requestId);
+          reject(err);
+        }
       });
     });
   }
 
+  // Pack several calls into one JSON-RPC batch frame: one ws.send instead
+  // of one round-trip per call.
+  async rpcBatch(calls) {
+    if (calls.length === 0) return [];
+    const ws = await this._ensureConnected();
+    const requests = calls.map(([method, params]) => ({
+      jsonrpc: "2.0",
+      id: this._nextRequestId(),
+      method,
+      params
+    }));
+    const results = requests.map(
+      (request) =>
+        new Promise((resolve, reject) => {
+          this.pending.set(request.id, { resolve, reject });
+        })
+    );
+    ws.send(JSON.stringify(requests), (err) => {
+      if (err) {
+        for (const request of requests) {
+          const entry = this.pending.get(request.id);
+          if (entry) {
+            this.pending.delete(request.id);
+            entry.reject(err);
+          }
+        }
+      }
+    });
+    return Promise.all(results);
+  }
+
   readInbox() {
-    return this.rpc("readResource", { uri: "resource://telegram.inbox" });
+    return this.rpc("readResource", MCP_INBOX_PARAMS);
   }
 
   sendMessage(chatId, text) {
@@ -173,6 +355,80 @@ class McpClient {
       arguments: { chatId, text }
     });
   }
+
+  sendMessages(pairs) {
+    return this.rpcBatch(
+      pairs.map(([chatId, text]) => [
+        "callTool",
+        { name: "telegram.send", arguments: { chatId, text } }
+      ])
+    );
+  }
+}
+
+// Numeric knobs parsed and frozen once; client constructors read these
+// instead of re-coercing raw env strings.
+const AGENT_CONFIG = Object.freeze({
+  temperature: Number(AGENT_TEMPERATURE),
+  maxTokens: Number(AGENT_MAX_TOKENS),
+  historyLimit: Number(AGENT_HISTORY_LIMIT),
+  openwebuiHistoryLimit: Number(OPENWEBUI_HISTORY_LIMIT)
+});
+
+const STREAMING_ENABLED = AGENT_STREAMING.trim().toLowerCase() === "true";
+const STREAM_CHUNK_LIMIT = Math.max(1, Number(STREAM_CHUNK_CHARS) || 400);
+const STREAM_FLUSH_INTERVAL_MS = Math.max(100, Number(STREAM_FLUSH_MS) || 1500);
+
+// Shared SSE reader for OpenAI-compatible chat/completions endpoints.
+// Invokes onDelta with each content fragment and the accumulated text.
+async function streamChatCompletions({ url, headers, payload, agent, onDelta }) {
+  const response = await fetch(url, {
+    method: "POST",
+    agent,
+    headers,
+    body: JSON.stringify({ ...payload, stream: true })
+  });
+
+  if (!response.ok) {
+    const data = await response.json().catch(() => null);
+    const detail = data?.error?.message || response.statusText;
+    throw new Error(`Streaming request failed: ${detail}`);
+  }
+
+  let full = "";
+  let buffer = "";
+  for await (const chunk of response.body) {
+    buffer += chunk.toString("utf8");
+    let newline;
+    while ((newline = buffer.indexOf("\n")) !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      if (!line.startsWith("data:")) continue;
+      const frame = line.slice(5).trim();
+      if (!frame || frame === "[DONE]") continue;
+      let parsed;
+      try {
+        parsed = JSON.parse(frame);
+      } catch (_) {
+        continue;
+      }
+      const delta = parsed?.choices?.[0]?.delta?.content || "";
+      if (delta) {
+        full += delta;
+        if (onDelta) await onDelta(delta, full);
+      }
+    }
+  }
+  return full;
+}
+
+// Bounded append for per-session histories: one splice instead of a
+// shift-per-element loop when the window overflows.
+function pushBounded(history, limit, ...messages) {
+  history.push(...messages);
+  if (limit > 0 && history.length > limit) {
+    history.splice(0, history.length - limit);
+  }
 }
 
 class IonOsClient {
@@ -183,11 +439,12 @@ class IonOsClient {
     this.baseUrl = AGENT_API_BASE_URL.replace(/\/+$/, "");
     this.apiKey = AGENT_API_KEY;
     this.model = AGENT_MODEL;
-    this.temperature = Number(AGENT_TEMPERATURE);
-    this.maxTokens = Number(AGENT_MAX_TOKENS);
-    this.historyLimit = Number(AGENT_HISTORY_LIMIT);
+    this.temperature = AGENT_CONFIG.temperature;
+    this.maxTokens = AGENT_CONFIG.maxTokens;
+    this.historyLimit = AGENT_CONFIG.historyLimit;
     this.systemPrompt = AGENT_SYSTEM_PROMPT;
     this.histories = new Map();
+    this.agent = selectSharedAgent;
   }
 
   _buildHistory(sessionId) {
@@ -213,6 +470,7 @@ class IonOsClient {
 
     const response = await fetch(`${this.baseUrl}/chat/completions`, {
       method: "POST",
+      agent: this.agent,
       headers: {
         "Content-Type": "application/json",
         Authorization: `Bearer ${this.apiKey}`
@@ -235,15 +493,52 @@ class IonOsClient {
     const content = choice?.message?.content?.trim() || "(Empty response from IONOS AI Hub)";
 
     if (history) {
-      history.push({ role: "user", content: prompt });
-      history.push({ role: "assistant", content });
-      while (history.length > this.historyLimit) {
-        history.shift();
-      }
+      pushBounded(
+        history,
+        this.historyLimit,
+        { role: "user", content: prompt },
+        { role: "assistant", content }
+      );
     }
 
     return content;
   }
+
+  async generateStream(prompt, sessionId, onDelta) {
+    const history = this._buildHistory(sessionId);
+    const messages = history ? [...history] : [];
+    if (!history && this.systemPrompt) {
+      messages.push({ role: "system", content: this.systemPrompt });
+    }
+    messages.push({ role: "user", content: prompt });
+
+    const full = await streamChatCompletions({
+      url: `${this.baseUrl}/chat/completions`,
+      agent: this.agent,
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${this.apiKey}`
+      },
+      payload: {
+        model: this.model,
+        messages,
+        temperature: this.temperature,
+        max_tokens: this.maxTokens
+      },
+      onDelta
+    });
+
+    const content = full.trim() || "(Empty response from IONOS AI Hub)";
+    if (history) {
+      pushBounded(
+        history,
+        this.historyLimit,
+        { role: "user", content: prompt },
+        { role: "assistant", content }
+      );
+    }
+    return content;
+  }
 }
 
 class OpenWebUIClient {
@@ -257,9 +552,10 @@ class OpenWebUIClient {
     this.baseUrl = OPENWEBUI_API_BASE_URL.replace(/\/+$/, "");
     this.apiKey = OPENWEBUI_API_KEY;
     this.model = OPENWEBUI_MODEL;
-    this.historyLimit = Number(OPENWEBUI_HISTORY_LIMIT);
+    this.historyLimit = AGENT_CONFIG.openwebuiHistoryLimit;
     this.systemPrompt = AGENT_SYSTEM_PROMPT;
     this.histories = new Map();
+    this.agent = selectSharedAgent;
   }
 
   _history(sessionId) {
@@ -284,6 +580,7 @@ class OpenWebUIClient {
 
     const response = await fetch(`${this.baseUrl}/api/v1/chat/completions`, {
       method: "POST",
+      agent: this.agent,
       headers: {
         "Content-Type": "application/json",
         Authorization: `Bearer ${this.apiKey}`
@@ -304,15 +601,50 @@ class OpenWebUIClient {
     const content = choice?.message?.content?.trim() || "(Empty response from OpenWebUI)";
 
     if (history) {
-      history.push({ role: "user", content: prompt });
-      history.push({ role: "assistant", content });
-      while (history.length > this.historyLimit) {
-        history.shift();
-      }
+      pushBounded(
+        history,
+        this.historyLimit,
+        { role: "user", content: prompt },
+        { role: "assistant", content }
+      );
     }
 
     return content;
   }
+
+  async generateStream(prompt, sessionId, onDelta) {
+    const history = this._history(sessionId);
+    const messages = history ? [...history] : [];
+    if (!history && this.systemPrompt) {
+      messages.push({ role: "system", content: this.systemPrompt });
+    }
+    messages.push({ role: "user", content: prompt });
+
+    const full = await streamChatCompletions({
+      url: `${this.baseUrl}/api/v1/chat/completions`,
+      agent: this.agent,
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${this.apiKey}`
+      },
+      payload: {
+        model: this.model,
+        messages
+      },
+      onDelta
+    });
+
+    const content = full.trim() || "(Empty response from OpenWebUI)";
+    if (history) {
+      pushBounded(
+        history,
+        this.historyLimit,
+        { role: "user", content: prompt },
+        { role: "assistant", content }
+      );
+    }
+    return content;
+  }
 }
 
 class OpenAIResponsesClient {
@@ -328,6 +660,7 @@ class OpenAIResponsesClient {
     this.agentId = OPENAI_AGENT_ID;
     this.model = OPENAI_MODEL;
     this.conversations = new Map();
+    this.agent = selectSharedAgent;
   }
 
   async generate(prompt, sessionId) {
@@ -352,6 +685,7 @@ class OpenAIResponsesClient {
 
     const response = await fetch(`${this.baseUrl}/responses`, {
       method: "POST",
+      agent: this.agent,
       headers: {
         "Content-Type": "application/json",
         Authorization: `Bearer ${this.apiKey}`,
@@ -387,45 +721,357 @@ class OpenAIResponsesClient {
   }
 }
 
+const EMBED_BATCH_LIMIT = 128;
+const EMBED_CACHE_TTL_MS = 86400 * 1000;
+const EMBED_CACHE_MAX_ENTRIES = 4096;
+
+// Keys are truncated sha256 digests of normalized text, so re-asked
+// prompts never hit the embedding endpoint twice within the TTL.
+class EmbeddingCache {
+  constructor(ttlMs = EMBED_CACHE_TTL_MS, maxEntries = EMBED_CACHE_MAX_ENTRIES) {
+    this.ttlMs = ttlMs;
+    this.maxEntries = maxEntries;
+    this.store = new Map();
+  }
+
+  static keyFor(text) {
+    return crypto
+      .createHash("sha256")
+      .update(text.trim().toLowerCase())
+      .digest("hex")
+      .slice(0, 32);
+  }
+
+  getMany(texts) {
+    const now = Date.now();
+    return texts.map((text) => {
+      const key = EmbeddingCache.keyFor(text);
+      const entry = this.store.get(key);
+      if (!entry) return null;
+      if (now - entry.createdAt > this.ttlMs) {
+        this.store.delete(key);
+        return null;
+      }
+      return entry.vector;
+    });
+  }
+
+  setMany(texts, vectors) {
+    const now = Date.now();
+    texts.forEach((text, i) => {
+      const vector = vectors[i];
+      if (!vector) return;
+      this.store.set(EmbeddingCache.keyFor(text), { vector, createdAt: now });
+    });
+    while (this.store.size > this.maxEntries) {
+      this.store.delete(this.store.keys().next().value);
+    }
+  }
+}
+
+class EmbeddingClient {
+  constructor() {
+    this.endpoint = EMBEDDING_API_URL.replace(/\/+$/, "");
+    this.apiKey = EMBEDDING_API_KEY;
+    this.model = EMBEDDING_MODEL;
+    this.agent = selectSharedAgent;
+    this.cache = new EmbeddingCache();
+  }
+
+  async _post(input) {
+    const headers = { "Content-Type": "application/json" };
+    if (this.apiKey) {
+      headers.Authorization = `Bearer ${this.apiKey}`;
+    }
+    const response = await fetch(`${this.endpoint}/embeddings`, {
+      method: "POST",
+      agent: this.agent,
+      headers,
+      body: JSON.stringify({ model: this.model, input })
+    });
+    const data = await response.json();
+    if (!response.ok) {
+      const detail = data?.error?.message || response.statusText;
+      throw new Error(`Embedding request failed: ${detail}`);
+    }
+    const vectors = (data?.data || []).map((item) => item?.embedding);
+    if (vectors.some((vector) => !Array.isArray(vector))) {
+      throw new Error("Embedding response contained no vector.");
+    }
+    return vectors;
+  }
+
+  // One HTTP request per EMBED_BATCH_LIMIT texts instead of one per text.
+  // Cache probes run first; only misses travel to the embedding API.
+  async embedBatch(texts) {
+    const vectors = this.cache.getMany(texts);
+    const missIndices = [];
+    const missTexts = [];
+    vectors.forEach((vector, i) => {
+      if (!vector) {
+        missIndices.push(i);
+        missTexts.push(texts[i]);
+      }
+    });
+
+    if (missTexts.length > 0) {
+      const fetched = [];
+      for (let i = 0; i < missTexts.length; i += EMBED_BATCH_LIMIT) {
+        const chunk = missTexts.slice(i, i + EMBED_BATCH_LIMIT);
+        fetched.push(...(await this._post(chunk)));
+      }
+      missIndices.forEach((target, i) => {
+        vectors[target] = fetched[i];
+      });
+      this.cache.setMany(missTexts, fetched);
+    }
+
+    return vectors;
+  }
+
+  async embed(text) {
+    const [vector] = await this.embedBatch([text]);
+    return vector;
+  }
+}
+
+function cosineDistance(a, b) {
+  let dot = 0;
+  let normA = 0;
+  let normB = 0;
+  for (let i = 0; i < a.length; i += 1) {
+    dot += a[i] * b[i];
+    normA += a[i] * a[i];
+    normB += b[i] * b[i];
+  }
+  if (normA === 0 || normB === 0) return 1;
+  return 1 - dot / Math.sqrt(normA * normB);
+}
+
+// Serves near-duplicate prompts ("what's the weather", "summarize this")
+// from a local vector store instead of paying the full LLM round-trip.
+class SemanticCacheAgent {
+  constructor(inner, embedder) {
+    this.inner = inner;
+    this.embedder = embedder;
+    this.entries = [];
+    this.ttlMs = Math.max(0, Number(SEMANTIC_CACHE_TTL) * 1000 || 0);
+    this.maxDistance = Number(SEMANTIC_CACHE_MAX_DISTANCE) || 0.1;
+    this.maxEntries = Math.max(1, Number(SEMANTIC_CACHE_MAX_ENTRIES) || 512);
+  }
+
+  _lookup(vector, sessionId) {
+    const now = Date.now();
+    this.entries = this.entries.filter(
+      (entry) => this.ttlMs === 0 || now - entry.createdAt < this.ttlMs
+    );
+    // Replies are generated with per-session history context, so a hit is
+    // only safe within the same session — never serve chat A's reply to a
+    // semantically similar question from chat B.
+    let best = null;
+    let bestDistance = Infinity;
+    for (const entry of this.entries) {
+      if (entry.sessionId !== sessionId) continue;
+      const distance = cosineDistance(vector, entry.vector);
+      if (distance < bestDistance) {
+        bestDistance = distance;
+        best = entry;
+      }
+    }
+    return bestDistance <= this.maxDistance ? best : null;
+  }
+
+  async generate(prompt, sessionId) {
+    let vector = null;
+    try {
+      vector = await this.embedder.embed(prompt);
+    } catch (err) {
+      logger.warn("[TelegramWorker] Semantic cache embedding failed:", err.message);
+    }
+
+    if (vector) {
+      const hit = this._lookup(vector, sessionId);
+      if (hit) {
+        logger.debug?.("[TelegramWorker] Semantic cache hit");
+        return hit.reply;
+      }
+    }
+
+    const reply = await this.inner.generate(prompt, sessionId);
+    if (vector && reply) {
+      this.entries.push({ vector, reply, sessionId, createdAt: Date.now() });
+      if (this.entries.length > this.maxEntries) {
+        this.entries.splice(0, this.entries.length - this.maxEntries);
+      }
+    }
+    return reply;
+  }
+
+  // Streaming bypasses the cache; partial output is not worth caching.
+  generateStream(prompt, sessionId, onDelta) {
+    if (typeof this.inner.generateStream !== "function") {
+      return this.inner.generate(prompt, sessionId);
+    }
+    return this.inner.generateStream(prompt, sessionId, onDelta);
+  }
+}
+
+// Zero-cost repeats: identical prompts against a deterministic (temp=0)
+// model always produce the same completion, so cache them exactly.
+class ExactCacheAgent {
+  constructor(inner, base) {
+    this.inner = inner;
+    this.base = base;
+    this.maxEntries = 4096;
+    this.cache = new Map(); // insertion order doubles as LRU order
+  }
+
+  _deterministic() {
+    return Number(this.base.temperature ?? NaN) === 0;
+  }
+
+  _key(prompt, sessionId) {
+    const history = this.base.histories?.get(sessionId);
+    const tail =
+      history && history.length > 0 ? history[history.length - 1].content || "" : "";
+    return crypto
+      .createHash("sha256")
+      .update(`${this.base.model}\0${prompt}\0${tail}`)
+      .digest("hex");
+  }
+
+  _recordExchange(sessionId, prompt, reply) {
+    const history = this.base.histories?.get(sessionId);
+    if (!history) return;
+    pushBounded(
+      history,
+      Number(this.base.historyLimit) || 0,
+      { role: "user", content: prompt },
+      { role: "assistant", content: reply }
+    );
+  }
+
+  async generate(prompt, sessionId) {
+    if (!this._deterministic()) {
+      return this.inner.generate(prompt, sessionId);
+    }
+
+    // Key must be computed before generate() mutates the session history.
+    const key = this._key(prompt, sessionId);
+    const hit = this.cache.get(key);
+    if (hit !== undefined) {
+      this.cache.delete(key);
+      this.cache.set(key, hit);
+      this._recordExchange(sessionId, prompt, hit);
+      logger.debug?.("[TelegramWorker] Exact cache hit");
+      return hit;
+    }
+
+    const reply = await this.inner.generate(prompt, sessionId);
+    if (reply) {
+      this.cache.set(key, reply);
+      if (this.cache.size > this.maxEntries) {
+        this.cache.delete(this.cache.keys().next().value);
+      }
+    }
+    return reply;
+  }
+
+  generateStream(prompt, sessionId, onDelta) {
+    if (typeof this.inner.generateStream !== "function") {
+      return this.inner.generate(prompt, sessionId);
+    }
+    return this.inner.generateStream(prompt, sessionId, onDelta);
+  }
+}
+
 function createAgentClient() {
   const provider = (AI_PROVIDER || "ionos").trim().toLowerCase();
+  let base;
   if (provider === "openwebui" || provider === "owui" || provider === "webui") {
-    return new OpenWebUIClient();
+    base = new OpenWebUIClient();
+  } else if (provider === "openai") {
+    base = new OpenAIResponsesClient();
+  } else {
+    base = new IonOsClient();
   }
-  if (provider === "openai") {
-    return new OpenAIResponsesClient();
+  let agent = base;
+  if (EMBEDDING_API_URL) {
+    agent = new SemanticCacheAgent(agent, new EmbeddingClient());
   }
-  return new IonOsClient();
+  // Cheapest check first: exact string match before the embedding lookup.
+  return new ExactCacheAgent(agent, base);
 }
 
 function extractInstruction(text) {
-  if (!text) return { shouldProcess: false, instruction: "" };
+  if (!text || !mayContainAiMarker(text)) {
+    return { shouldProcess: false, instruction: "" };
+  }
   const trimmed = text.trim();
   const lowered = trimmed.toLowerCase();
 
-  for (const prefix of AI_PREFIXES) {
-    if (lowered.startsWith(prefix)) {
-      const rest = trimmed.slice(prefix.length).replace(/^[:\s,-]+/, "");
-      return { shouldProcess: true, instruction: rest || trimmed };
-    }
+  const prefixLength = matchPrefix(lowered);
+  if (prefixLength > 0) {
+    const rest = trimmed.slice(prefixLength).replace(/^[:\s,-]+/, "");
+    return { shouldProcess: true, instruction: rest || trimmed };
   }
 
-  for (const phrase of AI_PHRASES) {
-    const idx = lowered.indexOf(phrase);
-    if (idx !== -1) {
-      const rest = trimmed.slice(idx + phrase.length).replace(/^[:\s,-]+/, "");
-      return { shouldProcess: true, instruction: rest || trimmed };
-    }
+  const phraseMatch = AI_PHRASE_RE.exec(lowered);
+  if (phraseMatch) {
+    const rest = trimmed
+      .slice(phraseMatch.index + phraseMatch[0].length)
+      .replace(/^[:\s,-]+/, "");
+    return { shouldProcess: true, instruction: rest || trimmed };
   }
 
   return { shouldProcess: false, instruction: "" };
 }
 
+const RECENT_IDS_LIMIT = 1024;
+
+// Ring of recently processed update ids: catches redelivered updates in
+// overlapping inbox windows before any per-update work is done.
+class RecentIds {
+  constructor(limit = RECENT_IDS_LIMIT) {
+    this.limit = limit;
+    this.queue = [];
+    this.set = new Set();
+  }
+
+  has(id) {
+    return this.set.has(id);
+  }
+
+  add(id) {
+    this.queue.push(id);
+    this.set.add(id);
+    if (this.queue.length > this.limit) {
+      this.set.delete(this.queue.shift());
+    }
+  }
+}
+
+// Serialize work per chat so replies stay in order, while independent
+// chats progress concurrently.
+function enqueueForChat(chatQueues, chatId, task) {
+  const prev = chatQueues.get(chatId) || Promise.resolve();
+  const next = prev.then(task, task);
+  const tracked = next.finally(() => {
+    if (chatQueues.get(chatId) === tracked) {
+      chatQueues.delete(chatId);
+    }
+  });
+  chatQueues.set(chatId, tracked);
+  return next;
+}
+
 async function main() {
   const stateStore = new StateStore(STATE_PATH);
   const state = await stateStore.load();
   const mcp = new McpClient(MCP_ENDPOINT);
   const agent = createAgentClient();
+  const chatQueues = new Map();
+  const recentIds = new RecentIds();
 
   let running = true;
   process.on("SIGINT", () => {
@@ -439,12 +1085,24 @@ async function main() {
 
   logger.info(`[TelegramWorker] Starting poll loop (interval=${POLL_INTERVAL_MS}ms) last_update_id=${state.lastUpdateId}`);
 
+  let consecutiveErrors = 0;
   while (running) {
     try {
-      await processCycle({ mcp, agent, state, stateStore });
+      await processCycle({ mcp, agent, state, stateStore, chatQueues, recentIds });
+      consecutiveErrors = 0;
     } catch (err) {
-      logger.error("[TelegramWorker] Cycle failed:", err);
-      await delay(Math.min(POLL_INTERVAL_MS * 2, 30000));
+      consecutiveErrors += 1;
+      // Exponential backoff with jitter so a fleet of workers doesn't
+      // retry in lockstep against a recovering MCP server or LLM.
+      const backoff = Math.min(
+        POLL_INTERVAL_MS * 2 ** consecutiveErrors + Math.random() * 500,
+        60000
+      );
+      logger.error(
+        `[TelegramWorker] Cycle failed (attempt ${consecutiveErrors}, backing off ${Math.round(backoff)}ms):`,
+        err
+      );
+      await delay(backoff);
     }
     await delay(POLL_INTERVAL_MS);
   }
@@ -453,7 +1111,63 @@ async function main() {
   logger.info("[TelegramWorker] Stopped. State persisted.");
 }
 
-async function processCycle({ mcp, agent, state, stateStore }) {
+// Push partial output to the chat as it streams in, instead of sitting
+// silent for the full completion. Returns null when everything was
+// already delivered incrementally.
+async function handleUpdateStreaming({ mcp, agent }, { chatId, text, instruction }) {
+  let sentChars = 0;
+  let lastFlush = Date.now();
+
+  const flush = async (full, force) => {
+    const pending = full.length - sentChars;
+    if (pending <= 0) return;
+    if (!force && pending < STREAM_CHUNK_LIMIT && Date.now() - lastFlush < STREAM_FLUSH_INTERVAL_MS) {
+      return;
+    }
+    const chunk = full.slice(sentChars);
+    sentChars = full.length;
+    lastFlush = Date.now();
+    try {
+      await mcp.sendMessage(chatId, chunk);
+    } catch (err) {
+      logger.error("[TelegramWorker] Failed to send Telegram chunk:", err);
+    }
+  };
+
+  const full = await agent.generateStream(instruction || text, chatId, (_delta, soFar) =>
+    flush(soFar, false)
+  );
+  if (sentChars === 0) {
+    return [chatId, full || "(No response generated.)"];
+  }
+  await flush(full, true);
+  return null;
+}
+
+async function handleUpdate({ mcp, agent }, update) {
+  const { chatId, updateId, text, instruction } = update;
+  logger.info(`[TelegramWorker] Processing AI request from chat ${chatId} update ${updateId}`);
+
+  if (STREAMING_ENABLED && typeof agent.generateStream === "function") {
+    try {
+      return await handleUpdateStreaming({ mcp, agent }, update);
+    } catch (err) {
+      logger.error("[TelegramWorker] Streaming agent error:", err);
+      return [chatId, "[!] Unable to reach the AI agent right now. Please try again later."];
+    }
+  }
+
+  let reply;
+  try {
+    reply = await agent.generate(instruction || text, chatId);
+  } catch (err) {
+    logger.error("[TelegramWorker] Agent error:", err);
+    reply = "[!] Unable to reach the AI agent right now. Please try again later.";
+  }
+  return [chatId, reply || "(No response generated.)"];
+}
+
+async function processCycle({ mcp, agent, state, stateStore, chatQueues, recentIds }) {
   const inbox = await mcp.readInbox();
   const updates = inbox?.resource?.data?.json?.updates || [];
   if (!Array.isArray(updates) || updates.length === 0) {
@@ -462,12 +1176,14 @@ async function processCycle({ mcp, agent, state, stateStore }) {
 
   logger.debug?.("[TelegramWorker] Retrieved updates:", updates.length);
 
+  const tasks = [];
   for (const update of updates) {
     const updateId = Number(update?.updateId) || 0;
-    if (updateId <= state.lastUpdateId) {
+    if (updateId <= state.lastUpdateId || recentIds.has(updateId)) {
       continue;
     }
 
+    recentIds.add(updateId);
     state.lastUpdateId = updateId;
 
     const chatId = update?.chat?.id != null ? String(update.chat.id) : null;
@@ -484,23 +1200,31 @@ async function processCycle({ mcp, agent, state, stateStore }) {
       continue;
     }
 
-    logger.info(`[TelegramWorker] Processing AI request from chat ${chatId} update ${updateId}`);
-    let reply;
-    try {
-      reply = await agent.generate(instruction || text, chatId);
-    } catch (err) {
-      logger.error("[TelegramWorker] Agent error:", err);
-      reply = "[!] Unable to reach the AI agent right now. Please try again later.";
-    }
+    // Fan out across chats; a slow LLM reply for one chat no longer
+    // stalls every other chat in the same cycle.
+    tasks.push(
+      enqueueForChat(chatQueues, chatId, () =>
+        handleUpdate({ mcp, agent }, { chatId, updateId, text, instruction })
+      )
+    );
+  }
 
-    try {
-      await mcp.sendMessage(chatId, reply || "(No response generated.)");
-    } catch (err) {
-      logger.error("[TelegramWorker] Failed to send Telegram message:", err);
+  if (tasks.length > 0) {
+    const settled = await Promise.allSettled(tasks);
+    // Flush all replies from this cycle as one JSON-RPC batch frame.
+    const pendingSends = settled
+      .filter((result) => result.status === "fulfilled" && result.value !== null)
+      .map((result) => result.value);
+    if (pendingSends.length > 0) {
+      try {
+        await mcp.sendMessages(pendingSends);
+      } catch (err) {
+        logger.error("[TelegramWorker] Failed to send Telegram messages:", err);
+      }
     }
   }
 
-  await stateStore.save(state);
+  await stateStore.saveIfDirty(state);
 }
 
 if (import.meta.url === `file://${process.argv[1]}`) {
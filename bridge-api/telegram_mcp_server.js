@@ -388,6 +388,20 @@ export function startTelegramMcpServer(options = {}) {
     sockets.add(ws);
     logDebug("Client connected", { totalClients: sockets.size });
 
+    async function dispatchRpc(request) {
+      if (request?.jsonrpc !== "2.0") {
+        sendErrorResponse(ws, request?.id ?? null, 400, "Invalid JSON-RPC envelope");
+        return;
+      }
+
+      try {
+        await handleRpc(ws, request);
+      } catch (err) {
+        logError("RPC handling error", err);
+        sendErrorResponse(ws, request?.id ?? null, 500, err.message);
+      }
+    }
+
     ws.on("message", async (raw) => {
       let parsed;
       try {
@@ -397,17 +411,33 @@ export function startTelegramMcpServer(options = {}) {
         return;
       }
 
-      if (parsed?.jsonrpc !== "2.0") {
-        sendErrorResponse(ws, parsed?.id ?? null, 400, "Invalid JSON-RPC envelope");
+      // JSON-RPC 2.0 batch: an array of request objects in one frame.
+      if (Array.isArray(parsed)) {
+        if (parsed.length === 0) {
+          sendErrorResponse(ws, null, 400, "Empty JSON-RPC batch");
+          return;
+        }
+        // telegram.send entries must reach Telegram in the order the
+        // client queued them, or two replies to the same chat can arrive
+        // swapped; run sends sequentially and everything else
+        // concurrently.
+        const isSendCall = (request) =>
+          request?.method === "callTool" &&
+          request?.params?.name === TELEGRAM_SEND_TOOL;
+        const sends = parsed.filter(isSendCall);
+        const others = parsed.filter((request) => !isSendCall(request));
+        await Promise.all([
+          (async () => {
+            for (const request of sends) {
+              await dispatchRpc(request);
+            }
+          })(),
+          ...others.map(dispatchRpc),
+        ]);
         return;
       }
 
-      try {
-        await handleRpc(ws, parsed);
-      } catch (err) {
-        logError("RPC handling error", err);
-        sendErrorResponse(ws, parsed?.id ?? null, 500, err.message);
-      }
+      await dispatchRpc(parsed);
     });
 
     ws.on("close", () => {
@@ -2,49 +2,286 @@
 title: Telegram MCP Tool
 author: Codex
 version: 0.1.0
-requirements: websocket-client
+requirements: websocket-client, wsaccel
 """
 
+import itertools
 import json
 import os
-import uuid
+import threading
+import time
+import weakref
 from typing import Any, Dict, Optional, Tuple
 
 from pydantic import Field
-from websocket import create_connection
+
+# websocket-client is imported on first connection instead of at module
+# load: OpenWebUI imports every tool file at startup, and the dependency
+# only matters once a call actually reaches the bridge. Until then the
+# exception placeholder can never match (no socket exists yet).
+create_connection: Any = None
+WebSocketConnectionClosedException: type = ConnectionError
+
+# True once wsaccel is found: websocket-client then masks frames and
+# validates UTF-8 in C instead of pure-Python loops.
+_WSACCEL = False
+
+
+def _load_websocket() -> None:
+    global create_connection, WebSocketConnectionClosedException, _WSACCEL
+    if create_connection is None:
+        try:
+            import wsaccel  # noqa: F401  (auto-detected by websocket-client)
+
+            _WSACCEL = True
+        except ImportError:
+            _WSACCEL = False
+        from websocket import (
+            WebSocketConnectionClosedException as _closed_exc,
+            create_connection as _connect,
+        )
+
+        create_connection = _connect
+        WebSocketConnectionClosedException = _closed_exc
 
 
 DEFAULT_URI = "ws://bridge-api:3030/"
 INBOX_RESOURCE = "resource://telegram.inbox"
 SEND_TOOL = "telegram.send"
 
+# Ping the shared socket when it has sat idle this long, so a dead
+# connection is detected before a request is written into the void.
+IDLE_PING_SECONDS = 30
+
+# The initialize envelope never varies, so serialize it once at import.
+# Its fixed id cannot collide with the per-request ids below.
+_INIT_ID = "init"
+_INIT_FRAME = json.dumps({"jsonrpc": "2.0", "id": _INIT_ID, "method": "initialize"})
+
+
+class _McpSessionError(RuntimeError):
+    """The bridge reported our MCP session is gone (e.g. code -32001).
+
+    The socket may still be open, but every further request would fail;
+    treated like a dropped connection so the caller reconnects and
+    re-initializes once.
+    """
+
+
+class _CircuitBreaker:
+    """CLOSED/OPEN/HALF_OPEN breaker so an unreachable bridge fails fast.
+
+    Without it every tool call blocks for the full 15s connect timeout
+    while the bridge is down; after a few consecutive failures the
+    breaker opens and calls raise immediately until the cool-down passes.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state != "open":
+            return True
+        if time.monotonic() - self.opened_at >= self.recovery_timeout:
+            self.state = "half_open"
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.state = "closed"
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        if (
+            self.state == "half_open"
+            or self.failure_count >= self.failure_threshold
+        ):
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+def _close_held_socket(holder: list) -> None:
+    """Finalizer target: close whatever socket the holder still references."""
+    ws = holder[0]
+    if ws is not None:
+        try:
+            ws.close()
+        except Exception:
+            pass
+
 
 class TelegramMcpClient:
-    """Minimal MCP client for one-shot interactions with the Telegram bridge."""
+    """MCP client keeping one initialized session to the Telegram bridge.
+
+    Opening a fresh websocket per call costs a TCP+WS handshake plus the
+    MCP initialize round-trip every time; the shared socket amortizes all
+    of that across calls and reconnects transparently if the bridge drops
+    it.
+    """
 
     def __init__(self, uri: Optional[str] = None) -> None:
         self.uri = (uri or os.getenv("TELEGRAM_MCP_WS_URL") or DEFAULT_URI).rstrip(
             "/"
         ) + "/"
+        # The socket lives in a one-slot holder so the weakref finalizer
+        # can close it without keeping the client itself alive.
+        self._ws_holder: list = [None]
+        self._lock = threading.Lock()
+        self._last_used = 0.0
+        # Guarded by self._lock, like the socket itself.
+        self._breaker = _CircuitBreaker()
+        # JSON-RPC ids only need to be unique per client; a counter is far
+        # cheaper than a UUID and count().__next__ is atomic under the GIL.
+        self._next_id = itertools.count(1).__next__
+        self._finalizer = weakref.finalize(
+            self, _close_held_socket, self._ws_holder
+        )
 
     # ------------------------------------------------------------------
     # Core JSON-RPC helpers
     # ------------------------------------------------------------------
+    def _get_ws(self) -> Any:
+        """Return the shared socket, (re)connecting and initializing if needed.
+
+        Callers must hold ``self._lock``.
+        """
+        _load_websocket()
+        ws = self._ws_holder[0]
+        if ws is not None and getattr(ws, "connected", False):
+            if time.monotonic() - self._last_used > IDLE_PING_SECONDS:
+                try:
+                    ws.ping()
+                except Exception:
+                    self._ws_holder[0] = None
+                    ws = None
+            if ws is not None:
+                return ws
+        if not self._breaker.allow():
+            raise RuntimeError(
+                "MCP bridge unavailable (circuit open); will retry after cool-down."
+            )
+        try:
+            # Python-level UTF-8 validation is only skipped when wsaccel's
+            # C fast paths cover masking and validation instead.
+            ws = create_connection(
+                self.uri,
+                timeout=15,
+                enable_multithread=True,
+                skip_utf8_validation=_WSACCEL,
+            )
+            ws.send(_INIT_FRAME)
+            self._await_result(ws, _INIT_ID)
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        self._ws_holder[0] = ws
+        return ws
+
     def _rpc(
         self, method: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Open a fresh MCP session, send one request, and return the result."""
-        ws = create_connection(self.uri, timeout=15)
-        try:
-            init_id = self._send(ws, "initialize", {})
-            self._await_result(ws, init_id)
-            return self._send_and_receive(ws, method, params or {})
-        finally:
-            ws.close()
+        """Send one request over the shared MCP session and return the result."""
+        with self._lock:
+            ws = self._get_ws()
+            try:
+                result = self._send_and_receive(ws, method, params or {})
+            except (WebSocketConnectionClosedException, OSError, _McpSessionError):
+                # Stale socket or lost MCP session (bridge restart, idle
+                # disconnect): drop it and retry once on a fresh session.
+                _close_held_socket(self._ws_holder)
+                self._ws_holder[0] = None
+                ws = self._get_ws()
+                result = self._send_and_receive(ws, method, params or {})
+            self._last_used = time.monotonic()
+            return result
+
+    def _rpc_batch(
+        self, calls: "list[Tuple[str, Dict[str, Any]]]"
+    ) -> "list[Dict[str, Any]]":
+        """Send several requests in one frame; return results in call order.
+
+        The bridge dispatches JSON-RPC 2.0 batch arrays concurrently, so N
+        calls cost a single round-trip instead of N sequential ones.
+        """
+        with self._lock:
+            ws = self._get_ws()
+            try:
+                results = self._send_batch_and_receive(ws, calls)
+            except (WebSocketConnectionClosedException, OSError, _McpSessionError):
+                _close_held_socket(self._ws_holder)
+                self._ws_holder[0] = None
+                ws = self._get_ws()
+                results = self._send_batch_and_receive(ws, calls)
+            self._last_used = time.monotonic()
+            return results
+
+    def _send_batch_and_receive(
+        self, ws: Any, calls: "list[Tuple[str, Dict[str, Any]]]"
+    ) -> "list[Dict[str, Any]]":
+        ids = []
+        batch = []
+        for method, params in calls:
+            request_id = self._next_id()
+            payload: Dict[str, Any] = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+            }
+            if params:
+                payload["params"] = params
+            ids.append(request_id)
+            batch.append(payload)
+        ws.send(json.dumps(batch))
+
+        pending = set(ids)
+        results: Dict[int, Dict[str, Any]] = {}
+        while pending:
+            raw = ws.recv()
+            if not raw:
+                raise RuntimeError("MCP server closed the connection unexpectedly.")
+            try:
+                message = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                raise RuntimeError(f"MCP server returned invalid JSON: {raw}") from exc
 
-    @staticmethod
-    def _send(ws: Any, method: str, params: Dict[str, Any]) -> str:
-        request_id = str(uuid.uuid4())
+            # Responses may arrive one frame each or as a batch array.
+            for msg in message if isinstance(message, list) else [message]:
+                msg_id = msg.get("id")
+                if msg_id not in pending:
+                    continue
+                if "error" in msg:
+                    error = msg["error"]
+                    detail = error.get("data") or error.get("message")
+                    if error.get("code") == -32001:
+                        raise _McpSessionError(f"MCP session lost: {detail}")
+                    raise RuntimeError(f"MCP error ({error.get('code')}): {detail}")
+                results[msg_id] = msg.get("result") or {}
+                pending.discard(msg_id)
+        return [results[request_id] for request_id in ids]
+
+    def close(self) -> None:
+        """Close the shared session; the next call reconnects lazily."""
+        with self._lock:
+            ws = self._ws_holder[0]
+            self._ws_holder[0] = None
+            if ws is not None:
+                try:
+                    ws.close()
+                except Exception:
+                    pass
+
+    def _send(self, ws: Any, method: str, params: Dict[str, Any]) -> int:
+        request_id = self._next_id()
         payload: Dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
         if params:
             payload["params"] = params
@@ -57,8 +294,12 @@ class TelegramMcpClient:
         target_id = self._send(ws, method, params)
         return self._await_result(ws, target_id)
 
-    def _await_result(self, ws: Any, target_id: Optional[str] = None) -> Dict[str, Any]:
-        """Consume socket messages until we get the response matching target_id."""
+    def _await_result(self, ws: Any, target_id: Optional[Any] = None) -> Dict[str, Any]:
+        """Consume socket messages until we get the response matching target_id.
+
+        Ids are monotonic ints for regular requests and the fixed string
+        id of the pre-serialized initialize frame.
+        """
         while True:
             raw = ws.recv()
             if not raw:
@@ -80,6 +321,8 @@ class TelegramMcpClient:
             if "error" in message:
                 error = message["error"]
                 detail = error.get("data") or error.get("message")
+                if error.get("code") == -32001:
+                    raise _McpSessionError(f"MCP session lost: {detail}")
                 raise RuntimeError(f"MCP error ({error.get('code')}): {detail}")
 
             return message.get("result") or {}
@@ -102,6 +345,13 @@ class TelegramMcpClient:
     def list_tools(self) -> Dict[str, Any]:
         return self._rpc("listTools")
 
+    def status(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch resources and tools in one batched round-trip."""
+        resources_res, tools_res = self._rpc_batch(
+            [("listResources", {}), ("listTools", {})]
+        )
+        return resources_res, tools_res
+
 
 class TelegramMcpTool:
     def __init__(self, client: Optional[TelegramMcpClient] = None) -> None:
@@ -143,8 +393,9 @@ class TelegramMcpTool:
 
     def mcp_status(self) -> str:
         """Display MCP resources and tools to confirm connectivity."""
-        resources = self.client.list_resources().get("resources", [])
-        tools = self.client.list_tools().get("tools", [])
+        resources_res, tools_res = self.client.status()
+        resources = resources_res.get("resources", [])
+        tools = tools_res.get("tools", [])
         return json.dumps(
             {
                 "resources": resources,
@@ -1,22 +1,108 @@
 """
 title: WordPress Post Manager
 author: OpenWebUI
-version: 1.3.1
-requirements: requests
+version: 1.4.0
+requirements: requests, httpx, orjson, cachetools, ijson, brotli
 description: |
-  Create a new WordPress blog post via the Bridge API. Retrieve details of a WordPress blog post by ID. 
-  Update an existing WordPress blog post (partial update). 
+  Create a new WordPress blog post via the Bridge API. Retrieve details of a WordPress blog post by ID.
+  Update an existing WordPress blog post (partial update).
   Search for WordPress blog posts using filters such as keywords, status, author, and sort order.
+  Async variants (acreate/aget/aupdate/asearch/adelete) allow concurrent calls via asyncio.gather.
 tags: wordpress, bridge, api, tools, openwebui
 """
 
+import functools
+import json
 import os
 import requests
+from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List
 
+try:
+    import httpx  # optional: only needed for the async a* variants
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # optional: 2-5x faster JSON decode/encode than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    from cachetools import TTLCache  # optional: short-TTL read caching
+    from cachetools.keys import hashkey
+except ImportError:
+    TTLCache = None
+    hashkey = None
+
+try:
+    import ijson  # optional: incremental parsing for large search pages
+except ImportError:
+    ijson = None
+
+# Transport exception groups shared by the requests and httpx paths, so the
+# per-method handlers work no matter which client served the call.
+if httpx is not None:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+else:
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError,)
+    _TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+
+# Environment snapshot taken once at import; the LLM tool layer often
+# instantiates Tools() per request, so repeated os.getenv lookups add up.
+_API_BASE_URL = os.getenv("API_BASE_URL")
+_BRIDGE_API_KEY = os.getenv("BRIDGE_API_KEY")
+
+# Server-side field projection: _fields= makes WP omit content.rendered,
+# meta and the _links envelope, which the summaries never use.
+_GET_FIELDS = {"_fields": "id,title,status,link,excerpt"}
+_LIST_FIELDS = "id,title,status,link"
+
+# Field order for create payloads; dict(zip(...)) over a constant tuple is
+# cheaper than a dict literal on CPython 3.11+.
+_CREATE_KEYS = ("title", "content", "status")
+
+# Preallocated success templates; format_map resolves each field with one
+# __getitem__ instead of re-running the f-string opcode sequence per call.
+_CREATE_OK_TPL = (
+    "✅ Blog post created successfully!\n\n"
+    "Title: {title}\n"
+    "ID: {id}\n"
+    "Status: {status}\n"
+    "URL: {link}"
+)
+_UPDATE_OK_TPL = (
+    "✅ Post updated successfully!\n\n"
+    "Title: {title}\n"
+    "ID: {id}\n"
+    "Status: {status}\n"
+    "URL: {link}"
+)
+_GET_OK_TPL = (
+    "📝 Post details\n\n"
+    "Title: {title}\n"
+    "ID: {id}\n"
+    "Status: {status}\n"
+    "URL: {link}\n\n"
+    "Excerpt:\n{excerpt}"
+)
+
+
+# Module-level (not a method) so lru_cache does not pin Tools instances.
+@functools.lru_cache(maxsize=256)
+def _build_url(api_base: str, parts: tuple) -> str:
+    base = api_base.rstrip("/")
+    tail = "/".join(p.strip("/") for p in parts if p is not None)
+    return f"{base}/{tail}" if tail else base
+
 
 class Tools:
-    API_BASE_URL = os.getenv("API_BASE_URL")  # Fetch from .env
+    API_BASE_URL = _API_BASE_URL  # snapshotted from .env at import time
 
     def __init__(self):
         """
@@ -29,11 +115,14 @@ class Tools:
         """
         if not self.API_BASE_URL:
             raise ValueError(
-                f"❌ API_BASE_URL is not set in the environment variables. API_BASE_URL: {os.getenv('API_BASE_URL')}"
+                f"❌ API_BASE_URL is not set in the environment variables. API_BASE_URL: {_API_BASE_URL}"
             )
         self.api_url = self.API_BASE_URL + "/posts"
+        # Precomputed once; the only variable URL part is the post id, so the
+        # hot paths can use a plain f-string instead of _safe_url().
+        self._collection_url = self.api_url.rstrip("/")
 
-        self.api_key = os.getenv("BRIDGE_API_KEY")
+        self.api_key = _BRIDGE_API_KEY
         if not self.api_key:
             raise ValueError(
                 "❌ BRIDGE_API_KEY is not set in the environment variables."
@@ -41,12 +130,109 @@ class Tools:
 
         self.timeout = 30  # Restrict timeout to prevent hanging requests
 
+        # Both header values are immutable after __init__, so build the dict
+        # once and reuse the same reference everywhere.
+        self._cached_headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+            # Many WP hosts only compress when the client advertises it
+            # explicitly; urllib3/httpx decompress transparently (brotli
+            # needs the brotli package installed).
+            "Accept-Encoding": "br, gzip",
+        }
+
+        # Reuse one session so keep-alive skips the TCP+TLS handshake on
+        # every call after the first. Headers are session defaults, so the
+        # per-call headers= kwarg is no longer needed.
+        self._session = requests.Session()
+        self._session.headers.update(self._cached_headers)
+        # Default adapters keep only 10 pooled connections and never retry;
+        # size the pool to match the httpx Limits below and let the adapter
+        # retry connection-level failures for idempotent methods only
+        # (status handling stays in _handle_response).
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                allowed_methods=frozenset(["GET", "PUT", "PATCH", "DELETE"]),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # httpx clients are created lazily on first use. The sync client
+        # upgrades _request to HTTP/2 multiplexing when httpx is installed;
+        # the session above remains the fallback transport.
+        self._client = None
+        self._aclient = None
+
+        # Short-TTL caches so repeated reads within a few seconds (a common
+        # LLM tool-loop pattern) skip the HTTP round trip entirely.
+        if TTLCache is not None:
+            self._get_cache = TTLCache(maxsize=512, ttl=60)
+            self._search_cache = TTLCache(maxsize=256, ttl=30)
+        else:
+            self._get_cache = None
+            self._search_cache = None
+
     # ---------- internal helpers ----------
     def _headers(self) -> Dict[str, str]:
-        h = {"Content-Type": "application/json"}
-        if self.api_key:
-            h["X-API-Key"] = self.api_key
-        return h
+        return self._cached_headers
+
+    def _invalidate_post(self, post_id) -> None:
+        """Drop a post from the read caches after a mutation.
+
+        Search results embed titles/statuses/links of many posts, so any
+        cached page may now be stale — clear that cache wholesale rather
+        than serving pre-mutation listings for up to its TTL.
+        """
+        if self._get_cache is not None:
+            self._get_cache.pop(post_id, None)
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
+    def _encode_json(self, payload: Dict[str, Any]) -> bytes:
+        """Serialize a request body, preferring orjson when available."""
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        ok=(200,),
+    ) -> Any:
+        """
+        Shared dispatch for the sync methods: issue the request on the pooled
+        client and normalize the response. Transport exceptions propagate so
+        each caller can keep its own user-facing message.
+        """
+        body = self._encode_json(json_body) if json_body is not None else None
+        if httpx is not None:
+            # Send streamed so _handle_response can cap how much of an
+            # error body is pulled off the wire, mirroring the requests
+            # branch below.
+            client = self._ensure_client()
+            r = client.send(
+                client.build_request(method, url, content=body, params=params),
+                stream=True,
+            )
+        else:
+            r = self._session.request(
+                method,
+                url,
+                data=body,
+                params=params,
+                timeout=self.timeout,
+                stream=True,
+            )
+        return self._handle_response(r, ok_statuses=ok)
 
     def _handle_response(self, r, ok_statuses=(200,)) -> Any:
         """
@@ -67,6 +253,12 @@ class Tools:
 
         if status in ok_statuses:
             try:
+                # Streamed httpx responses must be read before .content.
+                if hasattr(r, "is_stream_consumed") and not r.is_stream_consumed:
+                    r.read()
+                # orjson takes raw bytes, skipping the text-decoding pass.
+                if orjson is not None:
+                    return orjson.loads(r.content)
                 return r.json()
             except Exception:
                 try:
@@ -74,18 +266,172 @@ class Tools:
                 except Exception:
                     return {"raw": "<no text>"}
 
-        # Non-OK path
+        # Non-OK path: with stream=True only the first 2KB of the error body
+        # is read off the wire (WP error dumps can be MBs of HTML).
         detail = ""
         try:
-            detail = r.text[:2000]
+            if hasattr(r, "iter_content"):
+                detail = next(r.iter_content(2048, decode_unicode=True), "") or ""
+                if isinstance(detail, bytes):
+                    detail = detail.decode("utf-8", "replace")
+                r.close()
+            elif hasattr(r, "iter_bytes") and not getattr(
+                r, "is_stream_consumed", True
+            ):
+                # Streamed httpx response: same bounded read as above.
+                chunk = next(r.iter_bytes(2048), b"")
+                detail = chunk.decode("utf-8", "replace")
+                r.close()
+            else:
+                detail = r.text[:2000]
         except Exception:
             detail = "<no text>"
         return {"error": f"HTTP {status}", "detail": detail}
 
     def _safe_url(self, *parts: str) -> str:
-        base = self.api_url.rstrip("/")
-        tail = "/".join(p.strip("/") for p in parts if p is not None)
-        return f"{base}/{tail}" if tail else base
+        return _build_url(self.api_url, parts)
+
+    def _ensure_client(self):
+        """Create the shared sync httpx.Client on first use."""
+        if self._client is None:
+            limits = httpx.Limits(
+                max_keepalive_connections=20, max_connections=50
+            )
+            try:
+                # HTTP/2 lets one socket carry overlapping search/get calls;
+                # needs the optional h2 extra.
+                self._client = httpx.Client(
+                    headers=self._cached_headers,
+                    timeout=self.timeout,
+                    http2=True,
+                    limits=limits,
+                )
+            except ImportError:
+                self._client = httpx.Client(
+                    headers=self._cached_headers,
+                    timeout=self.timeout,
+                    limits=limits,
+                )
+        return self._client
+
+    def _ensure_aclient(self):
+        """Create the shared httpx.AsyncClient on first use."""
+        if httpx is None:
+            raise RuntimeError(
+                "httpx is not installed; async variants are unavailable."
+            )
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                headers=self._cached_headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20, max_connections=50
+                ),
+            )
+        return self._aclient
+
+    def close(self) -> None:
+        """Release the pooled sync transports (session + httpx client)."""
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Release the shared httpx.AsyncClient, if one was created."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def __del__(self):
+        # Best-effort cleanup for tool instances the host discards without
+        # calling close(); interpreter teardown can leave attributes half
+        # torn down, so never let this raise.
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # ---------- shared result formatting (sync + async paths) ----------
+
+    def _format_create_ok(self, data, title, status) -> str:
+        # Seed the fallbacks, then let the response overwrite them.
+        fields = {"title": title, "id": "Unknown", "status": status, "link": "N/A"}
+        fields.update(data)
+        return _CREATE_OK_TPL.format_map(fields)
+
+    def _format_get_ok(self, data, post_id) -> str:
+        # Ensure excerpt is a string before slicing
+        excerpt = data.get("excerpt", {}).get("rendered", "")
+        if not isinstance(excerpt, str):
+            excerpt = ""
+
+        # Short excerpts (the common case) pass through without any
+        # slicing or concatenation.
+        preview = excerpt if len(excerpt) <= 500 else excerpt[:500] + "…"
+        dd = defaultdict(lambda: "N/A", data)
+        dd["title"] = data.get("title", {}).get("rendered", "N/A")
+        dd["excerpt"] = preview
+        if "id" not in data:
+            dd["id"] = post_id
+        return _GET_OK_TPL.format_map(dd)
+
+    def _format_update_ok(self, data, post_id, title, status) -> str:
+        dd = defaultdict(lambda: "N/A", data)
+        dd["title"] = data.get("title", {}).get("rendered", title or "N/A")
+        if "id" not in data:
+            dd["id"] = post_id
+        if "status" not in data and status:
+            dd["status"] = status
+        return _UPDATE_OK_TPL.format_map(dd)
+
+    def _format_search_stream(self, r, page) -> str:
+        """
+        Incrementally parse a large search response with ijson, formatting
+        each post as it arrives instead of materializing the whole
+        list[dict] (content.rendered etc.) in memory first. A malformed
+        200 body (truncated JSON, HTML error page) degrades to an error
+        string instead of raising out of the search call.
+        """
+        r.raw.decode_content = True  # transparently inflate gzip/brotli
+        lines: List[str] = []
+        try:
+            for p in ijson.items(r.raw, "item"):
+                lines.append(
+                    f"- [{p.get('id','?')}] {p.get('title','(no title)')} "
+                    f"— {p.get('status','?')} — {p.get('link','N/A')}"
+                )
+        except (ijson.JSONError, ValueError) as e:
+            return f"❌ Search failed: unreadable response from Bridge API ({e})"
+        if not lines:
+            return "🔎 No posts found."
+        return (
+            f"🔎 Search results (page {page}, {len(lines)} item(s)):\n"
+            + "\n".join(lines)
+        )
+
+    def _format_search_ok(self, data, page) -> str:
+        if not isinstance(data, list) or not data:
+            return "🔎 No posts found."
+        if len(data) > 200:
+            # Bulk path (export/analytics flows): pull each column once in a
+            # structure-of-arrays pass, then let map() drive the template's
+            # C-level format loop instead of N interpreted f-strings.
+            ids = [p.get("id", "?") for p in data]
+            titles = [p.get("title", "(no title)") for p in data]
+            statuses = [p.get("status", "?") for p in data]
+            links = [p.get("link", "N/A") for p in data]
+            body = "\n".join(
+                map("- [{}] {} — {} — {}".format, ids, titles, statuses, links)
+            )
+        else:
+            # Single comprehension + join: no per-item append lookups.
+            body = "\n".join(
+                f"- [{p.get('id','?')}] {p.get('title','(no title)')} "
+                f"— {p.get('status','?')} — {p.get('link','N/A')}"
+                for p in data
+            )
+        return f"🔎 Search results (page {page}, {len(data)} item(s)):\n{body}"
 
     # ---------- main functions (LLM-annotated) ----------
 
@@ -107,30 +453,23 @@ class Tools:
         Example:
           tools.create_wordpress_post("Hello", "<p>Body</p>", "publish")
         """
-        payload = {"title": title, "content": content, "status": status}
+        payload = dict(zip(_CREATE_KEYS, (title, content, status)))
         try:
-            r = requests.post(
-                self._safe_url(),
-                json=payload,
-                headers=self._headers(),
-                timeout=self.timeout,
+            data = self._request(
+                "POST", self._collection_url, json_body=payload, ok=(200, 201)
             )
-            data = self._handle_response(r, ok_statuses=(200, 201))
             if "error" in data:
                 return f"❌ Error creating post ({data['error']}):\n{data.get('detail','')}"
-            return (
-                "✅ Blog post created successfully!\n\n"
-                f"Title: {data.get('title', title)}\n"
-                f"ID: {data.get('id', 'Unknown')}\n"
-                f"Status: {data.get('status', status)}\n"
-                f"URL: {data.get('link', 'N/A')}"
-            )
-        except requests.exceptions.Timeout:
+            return self._format_create_ok(data, title, status)
+        except _TIMEOUT_ERRORS:
             return "❌ Request timed out. Please try again."
-        except requests.exceptions.ConnectionError:
+        except _CONNECT_ERRORS:
             return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    # Call-site specialization for bulk-draft workflows.
+    make_draft = functools.partialmethod(create_wordpress_post, status="draft")
 
     def get_wordpress_post(self, post_id: int) -> str:
         """
@@ -146,36 +485,71 @@ class Tools:
         Example:
           tools.get_wordpress_post(123)
         """
+        if self._get_cache is not None:
+            cached = self._get_cache.get(post_id)
+            if cached is not None:
+                return cached
+
         try:
-            r = requests.get(
-                self._safe_url(str(post_id)),
-                headers=self._headers(),
-                timeout=self.timeout,
+            data = self._request(
+                "GET", f"{self._collection_url}/{post_id}", params=_GET_FIELDS
             )
-            data = self._handle_response(r, ok_statuses=(200,))
             if "error" in data:
                 return f"❌ Error fetching post {post_id} ({data['error']}):\n{data.get('detail','')}"
+            result = self._format_get_ok(data, post_id)
+            if self._get_cache is not None:
+                self._get_cache[post_id] = result
+            return result
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while fetching the post."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    def get_wordpress_posts(self, ids: List[int]) -> str:
+        """
+        Description (LLM):
+          Fetch several WordPress posts in a single request. Prefer this over
+          calling get_wordpress_post in a loop — N round trips become one.
 
-            # Ensure excerpt is a string before slicing
-            excerpt = data.get("excerpt", {}).get("rendered", "")
-            if not isinstance(excerpt, str):
-                excerpt = ""
+        Args:
+          ids (List[int]): WordPress post IDs.
 
-            preview = excerpt[:500] + ("…" if len(excerpt) > 500 else "")
-            return (
-                "📝 Post details\n\n"
-                f"Title: {data.get('title', {}).get('rendered', 'N/A')}\n"
-                f"ID: {data.get('id', post_id)}\n"
-                f"Status: {data.get('status', 'N/A')}\n"
-                f"URL: {data.get('link', 'N/A')}\n\n"
-                f"Excerpt:\n{preview}"
+        Returns:
+          str: One summary line per post in the form:
+               - [ID] Title — status — URL
+
+        Example:
+          tools.get_wordpress_posts([12, 34, 56])
+        """
+        if not ids:
+            return "ℹ️ No post IDs provided."
+
+        params = {
+            "include": ",".join(map(str, ids)),
+            "per_page": len(ids),
+            "_fields": _LIST_FIELDS,
+        }
+        try:
+            data = self._request("GET", self._collection_url, params=params)
+            if isinstance(data, dict) and "error" in data:
+                return f"❌ Error fetching posts ({data['error']}):\n{data.get('detail','')}"
+            if not isinstance(data, list) or not data:
+                return "🔎 No posts found."
+
+            body = "\n".join(
+                f"- [{p.get('id','?')}] {p.get('title','(no title)')} "
+                f"— {p.get('status','?')} — {p.get('link','N/A')}"
+                for p in data
             )
-        except requests.exceptions.Timeout:
-            return "❌ Request timed out while fetching the post."
-        except requests.exceptions.ConnectionError:
+            return f"📝 {len(data)} post(s):\n{body}"
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while fetching posts."
+        except _CONNECT_ERRORS:
             return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
 
     def update_wordpress_post(
         self,
@@ -215,28 +589,19 @@ class Tools:
 
         try:
             # Use PATCH instead of POST for partial updates
-            r = requests.patch(
-                self._safe_url(str(post_id)),
-                json=payload,
-                headers=self._headers(),
-                timeout=self.timeout,
+            data = self._request(
+                "PATCH", f"{self._collection_url}/{post_id}", json_body=payload
             )
-            data = self._handle_response(r, ok_statuses=(200,))
             if "error" in data:
                 return f"❌ Error updating post {post_id} ({data['error']}):\n{data.get('detail','')}"
-            return (
-                "✅ Post updated successfully!\n\n"
-                f"Title: {data.get('title', {}).get('rendered', title or 'N/A')}\n"
-                f"ID: {data.get('id', post_id)}\n"
-                f"Status: {data.get('status', status or 'N/A')}\n"
-                f"URL: {data.get('link', 'N/A')}"
-            )
-        except requests.exceptions.Timeout:
+            self._invalidate_post(post_id)
+            return self._format_update_ok(data, post_id, title, status)
+        except _TIMEOUT_ERRORS:
             return "❌ Request timed out while updating the post."
-        except requests.exceptions.ConnectionError:
+        except _CONNECT_ERRORS:
             return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
 
     def search_wordpress_posts(
         self,
@@ -279,35 +644,41 @@ class Tools:
             params["orderby"] = orderby
         if order:
             params["order"] = order
+        params["_fields"] = _LIST_FIELDS
+
+        cache_key = None
+        if self._search_cache is not None:
+            cache_key = hashkey(query, per_page, page, status, author, orderby, order)
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            r = requests.get(
-                self._safe_url(),
-                headers=self._headers(),
+            r = self._session.get(
+                self._collection_url,
                 params=params,
                 timeout=self.timeout,
+                stream=True,
             )
+            # Large pages: stream-parse instead of buffering the whole array.
+            if ijson is not None and per_page > 20 and r.status_code == 200:
+                result = self._format_search_stream(r, page)
+                if cache_key is not None:
+                    self._search_cache[cache_key] = result
+                return result
             data = self._handle_response(r, ok_statuses=(200,))
             if "error" in data:
                 return f"❌ Error searching posts ({data['error']}):\n{data.get('detail','')}"
-            if not isinstance(data, list) or not data:
-                return "🔎 No posts found."
-
-            lines: List[str] = [
-                f"🔎 Search results (page {page}, {len(data)} item(s)):"
-            ]
-            for p in data:
-                lines.append(
-                    f"- [{p.get('id','?')}] {p.get('title','(no title)')} "
-                    f"— {p.get('status','?')} — {p.get('link','N/A')}"
-                )
-            return "\n".join(lines)
-        except requests.exceptions.Timeout:
+            result = self._format_search_ok(data, page)
+            if cache_key is not None:
+                self._search_cache[cache_key] = result
+            return result
+        except _TIMEOUT_ERRORS:
             return "❌ Request timed out while searching posts."
-        except requests.exceptions.ConnectionError:
+        except _CONNECT_ERRORS:
             return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
 
     def delete_wordpress_post(self, post_id: int) -> str:
         """
@@ -324,18 +695,185 @@ class Tools:
           tools.delete_wordpress_post(123)
         """
         try:
-            r = requests.delete(
-                self._safe_url(str(post_id)),
-                headers=self._headers(),
-                timeout=self.timeout,
+            data = self._request("DELETE", f"{self._collection_url}/{post_id}")
+            if "error" in data:
+                return f"❌ Error deleting post {post_id} ({data['error']}):\n{data.get('detail','')}"
+            self._invalidate_post(post_id)
+            return f"✅ Post {post_id} deleted successfully."
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while deleting the post."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    # ---------- async variants (httpx) ----------
+    # Same behaviour as the sync methods above, but awaitable so callers can
+    # overlap several Bridge API round trips with asyncio.gather.
+
+    async def acreate_wordpress_post(
+        self, title: str, content: str, status: str = "publish"
+    ) -> str:
+        """
+        Description (LLM):
+          Async variant of create_wordpress_post.
+
+        Example:
+          await tools.acreate_wordpress_post("Hello", "<p>Body</p>")
+        """
+        if httpx is None:
+            return "❌ httpx is not installed; async variants are unavailable."
+        payload = dict(zip(_CREATE_KEYS, (title, content, status)))
+        try:
+            r = await self._ensure_aclient().post(
+                self._collection_url, content=self._encode_json(payload)
             )
+            data = self._handle_response(r, ok_statuses=(200, 201))
+            if "error" in data:
+                return f"❌ Error creating post ({data['error']}):\n{data.get('detail','')}"
+            return self._format_create_ok(data, title, status)
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out. Please try again."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    async def aget_wordpress_post(self, post_id: int) -> str:
+        """
+        Description (LLM):
+          Async variant of get_wordpress_post.
+
+        Example:
+          await tools.aget_wordpress_post(123)
+        """
+        if httpx is None:
+            return "❌ httpx is not installed; async variants are unavailable."
+        try:
+            r = await self._ensure_aclient().get(
+                f"{self._collection_url}/{post_id}", params=_GET_FIELDS
+            )
+            data = self._handle_response(r, ok_statuses=(200,))
+            if "error" in data:
+                return f"❌ Error fetching post {post_id} ({data['error']}):\n{data.get('detail','')}"
+            return self._format_get_ok(data, post_id)
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while fetching the post."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    async def aupdate_wordpress_post(
+        self,
+        post_id: int,
+        title: Optional[str] = None,
+        content: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> str:
+        """
+        Description (LLM):
+          Async variant of update_wordpress_post (PATCH).
+
+        Example:
+          await tools.aupdate_wordpress_post(123, title="Updated title")
+        """
+        if httpx is None:
+            return "❌ httpx is not installed; async variants are unavailable."
+        payload: Dict[str, Any] = {}
+        if title is not None:
+            payload["title"] = title
+        if content is not None:
+            payload["content"] = content
+        if status is not None:
+            payload["status"] = status
+
+        if not payload:
+            return (
+                "ℹ️ Nothing to update. Provide at least one of: title, content, status."
+            )
+
+        try:
+            r = await self._ensure_aclient().patch(
+                f"{self._collection_url}/{post_id}", content=self._encode_json(payload)
+            )
+            data = self._handle_response(r, ok_statuses=(200,))
+            if "error" in data:
+                return f"❌ Error updating post {post_id} ({data['error']}):\n{data.get('detail','')}"
+            self._invalidate_post(post_id)
+            return self._format_update_ok(data, post_id, title, status)
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while updating the post."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    async def asearch_wordpress_posts(
+        self,
+        query: Optional[str] = None,
+        per_page: int = 10,
+        page: int = 1,
+        status: Optional[str] = None,
+        author: Optional[int] = None,
+        orderby: Optional[str] = None,
+        order: Optional[str] = None,
+    ) -> str:
+        """
+        Description (LLM):
+          Async variant of search_wordpress_posts.
+
+        Example:
+          await tools.asearch_wordpress_posts(query="openwebui", per_page=5)
+        """
+        if httpx is None:
+            return "❌ httpx is not installed; async variants are unavailable."
+        params: Dict[str, Any] = {"per_page": per_page, "page": page}
+        if query:
+            params["search"] = query
+        if status:
+            params["status"] = status
+        if author is not None:
+            params["author"] = author
+        if orderby:
+            params["orderby"] = orderby
+        if order:
+            params["order"] = order
+        params["_fields"] = _LIST_FIELDS
+
+        try:
+            r = await self._ensure_aclient().get(self._collection_url, params=params)
+            data = self._handle_response(r, ok_statuses=(200,))
+            if "error" in data:
+                return f"❌ Error searching posts ({data['error']}):\n{data.get('detail','')}"
+            return self._format_search_ok(data, page)
+        except _TIMEOUT_ERRORS:
+            return "❌ Request timed out while searching posts."
+        except _CONNECT_ERRORS:
+            return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
+
+    async def adelete_wordpress_post(self, post_id: int) -> str:
+        """
+        Description (LLM):
+          Async variant of delete_wordpress_post.
+
+        Example:
+          await tools.adelete_wordpress_post(123)
+        """
+        if httpx is None:
+            return "❌ httpx is not installed; async variants are unavailable."
+        try:
+            r = await self._ensure_aclient().delete(f"{self._collection_url}/{post_id}")
             data = self._handle_response(r, ok_statuses=(200,))
             if "error" in data:
                 return f"❌ Error deleting post {post_id} ({data['error']}):\n{data.get('detail','')}"
+            self._invalidate_post(post_id)
             return f"✅ Post {post_id} deleted successfully."
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS:
             return "❌ Request timed out while deleting the post."
-        except requests.exceptions.ConnectionError:
+        except _CONNECT_ERRORS:
             return "❌ Cannot connect to the Bridge API. Check DNS/SSL/proxy."
-        except Exception as e:
-            return f"❌ Unexpected error: {e}"
+        except _TRANSPORT_ERRORS as e:
+            return f"❌ HTTP error: {e}"
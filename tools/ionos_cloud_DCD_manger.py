@@ -1,20 +1,266 @@
 """
 title: IONOS DCD Control
 author: OpenWebUI
-version: 0.1.0
-requirements: requests
+version: 0.2.0
+requirements: requests, httpx, cachetools, requests-cache, orjson, diskcache, ijson
 description: |
   Tools for managing IONOS Cloud Data Center Designer (DCD) resources,
   including datacenters and servers, via the IONOS Cloud API.
+  AsyncTools mirrors the provisioning flows on httpx for concurrent use.
 tags: ionos, cloud, datacenter, server, dcd, api, tools, openwebui
 """
 
+import asyncio
+import copy
 import json
+import logging
 import os
-from typing import Any, Dict, Iterable, Optional, Tuple
+import random
+import re
+import threading
+import time
+import types
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import httpx  # optional: only needed for AsyncTools
+except ImportError:
+    httpx = None
+
+try:
+    from cachetools import TTLCache  # optional: short-TTL GET caching
+except ImportError:
+    TTLCache = None
+
+try:
+    import requests_cache  # optional: HTTP-level caching with ETag revalidation
+except ImportError:
+    requests_cache = None
+
+try:
+    import orjson  # optional: faster JSON encoding for bodies and detail dumps
+except ImportError:
+    orjson = None
+
+try:
+    import diskcache  # optional: on-disk cache tier across tool processes
+except ImportError:
+    diskcache = None
+
+try:
+    import ijson  # optional: incremental parsing for list projections
+except ImportError:
+    ijson = None
+
+# OpenWebUI tool invocations can run in short-lived processes, so the
+# in-memory caches above die with them; a small SQLite-backed tier keeps
+# slow-changing collections (LANs, IP blocks) warm across restarts.
+if diskcache is not None:
+    try:
+        _DISK_CACHE = diskcache.Cache(
+            os.path.expanduser("~/.cache/ionos_tools")
+        )
+    except Exception:
+        _DISK_CACHE = None
+else:
+    _DISK_CACHE = None
+
+logger = logging.getLogger(__name__)
+
+# Shared pool for fanning out independent GETs; urllib3's connection pool
+# handles concurrent borrows on the shared session.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Shared params dict for the common "give me everything" queries; callers
+# must treat it as read-only.
+_DEPTH5 = {"depth": 5}
+
+# Transient statuses worth retrying with backoff. POSTs (create_*) are
+# not idempotent, so they only retry when the server rejected the call
+# before acting on it (rate limit / unavailable).
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_POST_RETRY_STATUSES = frozenset({429, 503})
+_RETRY_MAX_ATTEMPTS = 4
+_RETRY_BASE = 0.25
+_RETRY_CAP = 8.0
+
+# FIFO cap for the per-key memo dicts (ETag, body, last-known-good) on
+# the singleton Tools instance.
+_MEMO_MAX_ENTRIES = 512
+
+
+def _evict_oldest(memo: Dict[Any, Any]) -> None:
+    """Drop insertion-order-oldest entries once a memo outgrows the cap.
+
+    Callers must hold the owning instance's ``_cache_lock``.
+    """
+    while len(memo) > _MEMO_MAX_ENTRIES:
+        memo.pop(next(iter(memo)), None)
+
+
+_VM_STATE_EMOJI = {"RUNNING": "🟢", "STOPPED": "🔴", "BUSY": "🟡"}
+_LAN_PUBLIC = "Public 🌍"
+_LAN_PRIVATE = "Private 🔒"
+
+# Local sanity bounds for server specs, checked before any API call so a
+# bad value fails here instead of as a 422 after the LAN already exists.
+# Only the '<name>:<version>' shape is checked; which distros exist is
+# the API's call, not ours.
+_IMAGE_ALIAS_RE = re.compile(r"^[\w\-]+:[\w.\-]+$")
+_LAN_NAME_RE = re.compile(r"^[\w.\- ]{1,63}$")
+
+# Payload skeletons for the composite server-creation calls. The static
+# tree is built once at import; per call we deepcopy it and substitute
+# only the variable leaves instead of rebuilding the whole nested dict.
+_BOOT_SERVER_SKELETON = {
+    "properties": {
+        "name": None,
+        "cores": None,
+        "ram": None,
+        "availabilityZone": "AUTO",
+    },
+    "entities": {
+        "volumes": [
+            {
+                "properties": {
+                    "name": None,
+                    "size": None,
+                    "type": "HDD",
+                    "imageAlias": None,
+                    "licenceType": "LINUX",
+                    "bootVolume": True,
+                    # SSH key omitted → default key used
+                }
+            }
+        ],
+        "nics": [
+            {
+                "properties": {
+                    "name": "nic0",
+                    "lan": None,
+                    "dhcp": True,
+                }
+            }
+        ],
+    },
+}
+
+_DEFAULT_SERVER_SKELETON = {
+    "properties": {
+        "name": None,
+        "cores": 4,
+        "ram": 4096,
+        "availabilityZone": "AUTO",
+    },
+    "entities": {
+        "volumes": {
+            "items": [
+                {
+                    "properties": {
+                        "name": None,
+                        "size": 40,
+                        "type": "HDD",
+                        "imageAlias": None,
+                        "licenceType": "LINUX",
+                        "bootVolume": True,
+                        # SSH key omitted → default used
+                    }
+                }
+            ]
+        },
+        "nics": {
+            "items": [
+                {
+                    "properties": {
+                        "name": "nic0",
+                        "lan": None,
+                        "dhcp": True,
+                    }
+                }
+            ]
+        },
+    },
+}
+
+
+def _safe(val: Any, fallback: str = "<unknown>") -> Any:
+    """Fall back when the API returns an empty-ish placeholder value."""
+    return val if val not in (None, "", "None") else fallback
+
+
+class CircuitBreaker:
+    """Minimal CLOSED/OPEN/HALF_OPEN breaker for one backend endpoint.
+
+    When the API is unreachable, every composite flow would otherwise
+    grind through several calls each waiting out the full timeout; after
+    ``failure_threshold`` consecutive failures the breaker opens and calls
+    fail instantly until ``recovery_timeout`` passes, at which point a
+    single probe is let through.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state != "open":
+                return True
+            if time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failure_count = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            if (
+                self.state == "half_open"
+                or self.failure_count >= self.failure_threshold
+            ):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+# One breaker per backend base URL, shared by every client in the process.
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_breaker(key: str) -> CircuitBreaker:
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = _BREAKERS[key] = CircuitBreaker()
+        return breaker
+
+
+# The only response headers worth echoing into error details; copying the
+# whole CaseInsensitiveDict re-lowercases every key for data nobody reads.
+_ERROR_HEADER_KEYS = ("content-type", "x-request-id", "retry-after")
+
+
+def _error_headers(headers: Any) -> Dict[str, str]:
+    return {k: headers.get(k) for k in _ERROR_HEADER_KEYS if k in headers}
 
 
 class IonosConfig:
@@ -29,12 +275,12 @@ class IonosConfig:
         username = os.getenv("IONOS_USERNAME", "").strip()
         password = os.getenv("IONOS_PASSWORD", "").strip()
 
-        print(
-            "DEBUG: IonosConfig initialized with api_base:", self.api_base
-        )  # Debug line
-        print("DEBUG: IonosConfig token provided:", bool(token))  # Debug line
-        print("DEBUG: IonosConfig username provided:", bool(username))  # Debug line
-        print("DEBUG: IonosConfig password provided:", bool(password))  # Debug line
+        # %s-style lazy formatting: no argument rendering or I/O happens
+        # unless DEBUG logging is actually enabled.
+        logger.debug("IonosConfig initialized with api_base: %s", self.api_base)
+        logger.debug("IonosConfig token provided: %s", bool(token))
+        logger.debug("IonosConfig username provided: %s", bool(username))
+        logger.debug("IonosConfig password provided: %s", bool(password))
 
         self.auth: Optional[HTTPBasicAuth] = None
         if token:
@@ -47,33 +293,166 @@ class IonosConfig:
                 "Set IONOS_API_TOKEN or both IONOS_USERNAME and IONOS_PASSWORD."
             )
 
-        print("DEBUG: IonosConfig auth set:", self.auth is not None)  # Debug line
-        # Show only the first 12 characters of token for debugging (masked)
-        if "Authorization" in self.auth_header:
-            masked = self.auth_header["Authorization"][:20] + "..."
-            print(f"DEBUG: IonosConfig auth_header: Authorization: {masked}")
-        else:
-            print(f"DEBUG: IonosConfig auth_header: {self.auth_header}")
+        logger.debug("IonosConfig auth set: %s", self.auth is not None)
+        # Show only the first characters of the token when debugging (masked)
+        if logger.isEnabledFor(logging.DEBUG):
+            if "Authorization" in self.auth_header:
+                masked = self.auth_header["Authorization"][:20] + "..."
+                logger.debug("IonosConfig auth_header: Authorization: %s", masked)
+            else:
+                logger.debug("IonosConfig auth_header: %s", self.auth_header)
+
+        # Headers never change after construction; build them once and wrap
+        # in a read-only proxy so no caller can mutate the shared view. The
+        # session headers are the single source of truth downstream.
+        self._static_headers: Mapping[str, str] = types.MappingProxyType(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                **self.auth_header,
+            }
+        )
+
+    def headers(self) -> Mapping[str, str]:
+        return self._static_headers
+
+
+# Env vars do not change mid-process; parse them once and share the result
+# between Tools instances instead of re-reading on every instantiation.
+_DEFAULT_CONFIG: Optional[IonosConfig] = None
+
+
+def _default_config() -> IonosConfig:
+    global _DEFAULT_CONFIG
+    if _DEFAULT_CONFIG is None:
+        _DEFAULT_CONFIG = IonosConfig()
+    return _DEFAULT_CONFIG
 
-    def headers(self) -> Dict[str, str]:
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-        headers.update(self.auth_header)
-        return headers
+
+# A fresh Tools() per tool call would rebuild the Session, the urllib3
+# pool and the caches — N rapid calls means N TLS handshakes against
+# api.ionos.com. Default-constructed instances share one object instead.
+_TOOLS_LOCK = threading.Lock()
+_TOOLS_SINGLETON: Optional["Tools"] = None
 
 
 class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
-    """Helper utilities for interacting with the IONOS Cloud Data Center Designer."""
+    """Helper utilities for interacting with the IONOS Cloud Data Center Designer.
+
+    Runs on requests/HTTP-1.1: the bounded raw streaming, the adapter-level
+    connection retries and the optional requests_cache tier all hang off
+    the requests Session, and the pooled keep-alive connections already
+    amortize TLS across sequential calls. Heavily concurrent flows that
+    would benefit from HTTP/2 multiplexing one connection should use
+    ``AsyncTools``, whose httpx client negotiates HTTP/2 when the ``h2``
+    extra is installed.
+    """
+
+    def __new__(cls, config: Optional[IonosConfig] = None) -> "Tools":
+        # OpenWebUI's loader calls Tools() directly; hand back the shared
+        # instance unless the caller overrides the config explicitly.
+        if config is not None:
+            return super().__new__(cls)
+        global _TOOLS_SINGLETON
+        with _TOOLS_LOCK:
+            if _TOOLS_SINGLETON is None:
+                _TOOLS_SINGLETON = super().__new__(cls)
+            return _TOOLS_SINGLETON
 
     def __init__(self, config: Optional[IonosConfig] = None) -> None:
-        self.config = config or IonosConfig()
-        self.session = requests.Session()
+        # The singleton is handed back through __new__ with __init__ run
+        # again; skip the rebuild so the warm pool and caches survive.
+        if config is None and getattr(self, "_initialized", False):
+            return
+        self.config = config or _default_config()
+        # When requests_cache is installed, GETs go through an HTTP cache
+        # that honours Cache-Control and revalidates with If-None-Match, so
+        # unchanged resources cost a cheap 304 instead of a full body.
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name="ionos_api",
+                backend="memory",
+                cache_control=True,
+                expire_after=float(os.getenv("IONOS_HTTP_CACHE_TTL", "30")),
+                allowable_methods=("GET",),
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.config.headers())
         if self.config.auth is not None:
             self.session.auth = self.config.auth
 
+        # The default adapter keeps only 10 pooled connections and never
+        # retries; under the parallel inventory fetch that means pool-checkout
+        # stalls and fresh TLS handshakes on transient errors. Status-based
+        # retries live in _request (with jitter and Retry-After support), so
+        # the adapter only retries connection-level failures, and only for
+        # idempotent methods.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                allowed_methods=frozenset(["GET", "PUT", "PATCH", "DELETE"]),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Interactive sessions inspect the same DC repeatedly within seconds;
+        # a short TTL on GETs elides those API calls without risking stale
+        # views (any mutation through _request clears the cache). Tunable
+        # via IONOS_CACHE_TTL; 0 disables the in-memory tier entirely.
+        cache_ttl = float(os.getenv("IONOS_CACHE_TTL", "15"))
+        self._get_cache = (
+            TTLCache(maxsize=256, ttl=cache_ttl)
+            if TTLCache is not None and cache_ttl > 0
+            else None
+        )
+
+        # Conditional-GET memo: last ETag and body per (path, params), so
+        # repeated reads after the TTL window revalidate with
+        # If-None-Match and short-circuit on 304 instead of re-downloading
+        # and re-parsing an unchanged payload. These memos (and _lkg below)
+        # live on the process-wide singleton, so they are FIFO-capped at
+        # _MEMO_MAX_ENTRIES instead of growing without bound.
+        self._etag: Dict[Tuple[str, Tuple], str] = {}
+        self._body_cache: Dict[Tuple[str, Tuple], Any] = {}
+
+        # cachetools documents that shared caches need external locking,
+        # and the executor fan-outs read and invalidate these tiers from
+        # worker threads; one lock guards every read/write/clear.
+        self._cache_lock = threading.Lock()
+
+        # Single-flight map of in-flight GETs: when identical reads race
+        # (parallel dashboard tools), followers wait on the leader's Future
+        # and share its response instead of duplicating the round-trip.
+        self._inflight: Dict[Tuple[str, Tuple], Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Bulkhead: cap concurrent calls against the IONOS backend so a
+        # burst of chat sessions cannot open unbounded sockets and starve
+        # the rest of the worker pool. Excess callers wait briefly, then
+        # fail fast. inflight_calls is a best-effort gauge for debugging.
+        self._bulkhead = threading.BoundedSemaphore(
+            int(os.getenv("IONOS_MAX_INFLIGHT", "8"))
+        )
+        self.inflight_calls = 0
+
+        # Last-known-good bodies per GET key, kept without TTL: read-only
+        # callers opting in via allow_stale degrade to the previous
+        # snapshot when IONOS is unreachable instead of erroring out.
+        self._lkg: Dict[Tuple[str, Tuple], Tuple[float, Any]] = {}
+
+        # Hoisted out of _request: the base URL and timeout never change
+        # after construction, so build them once instead of per call.
+        self._base = self.config.api_base.rstrip("/") + "/"
+        self._timeout = 45
+        self._breaker = get_breaker(self.config.api_base)
+
+        self._initialized = True
+
     # ------------------------------------------------------------------
     # low level helpers
     # ------------------------------------------------------------------
@@ -85,37 +464,356 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         expected: Tuple[int, ...] = (200,),
         params: Optional[Dict[str, Any]] = None,
         json_body: Optional[Dict[str, Any]] = None,
+        raw_ok: bool = False,
+        idempotent: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        projection: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        allow_stale: bool = False,
     ) -> Tuple[bool, Any]:
-        url = f"{self.config.api_base}/{path.lstrip('/')}"
+        # Projected responses are consumed as a stream, so they bypass the
+        # memoisation tiers (the cache key would not capture the callable).
+        cache_key = None
+        cond_headers = None
+        if method.lower() == "get" and projection is None:
+            cache_key = (path, tuple(sorted((params or {}).items())))
+            with self._cache_lock:
+                if self._get_cache is not None:
+                    hit = self._get_cache.get(cache_key)
+                    if hit is not None:
+                        return hit
+                etag = self._etag.get(cache_key)
+            if etag is not None:
+                cond_headers = {"If-None-Match": etag}
+
+        if cache_key is None:
+            return self._perform_request(
+                method,
+                path,
+                expected=expected,
+                params=params,
+                json_body=json_body,
+                raw_ok=raw_ok,
+                idempotent=idempotent,
+                deadline=deadline,
+                projection=projection,
+                cache_key=None,
+                cond_headers=cond_headers,
+            )
+
+        # Single-flight: when several threads issue the same GET at once,
+        # only the first actually hits the API; the rest block on its
+        # Future and share the response.
+        with self._inflight_lock:
+            fut = self._inflight.get(cache_key)
+            leader = fut is None
+            if leader:
+                fut = Future()
+                self._inflight[cache_key] = fut
+        if not leader:
+            return self._maybe_stale(cache_key, fut.result(), allow_stale)
+
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
+            result = self._perform_request(
+                method,
+                path,
+                expected=expected,
                 params=params,
-                json=json_body,
-                timeout=45,
+                json_body=json_body,
+                raw_ok=raw_ok,
+                idempotent=idempotent,
+                deadline=deadline,
+                projection=projection,
+                cache_key=cache_key,
+                cond_headers=cond_headers,
             )
-        except requests.exceptions.Timeout:
+        except BaseException as exc:
+            fut.set_exception(exc)
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            raise
+        fut.set_result(result)
+        with self._inflight_lock:
+            self._inflight.pop(cache_key, None)
+        return self._maybe_stale(cache_key, result, allow_stale)
+
+    def _maybe_stale(
+        self,
+        cache_key: Tuple[str, Tuple],
+        result: Tuple[bool, Any],
+        allow_stale: bool,
+    ) -> Tuple[bool, Any]:
+        """Swap a transient failure for the last-known-good body, if allowed.
+
+        Only read paths that opted in via ``allow_stale`` ever see stale
+        data, and only for failures that suggest the API (not the request)
+        is the problem. The served body carries ``_stale_since`` so the
+        caller can render a staleness banner.
+        """
+        ok, payload = result
+        if ok or not allow_stale:
+            return result
+        error = payload.get("error", "") if isinstance(payload, dict) else ""
+        transient = (
+            error in ("timeout", "connection_error", "circuit_open", "bulkhead_full")
+            or error == "http_429"
+            or error.startswith("http_5")
+        )
+        with self._cache_lock:
+            stale = self._lkg.get(cache_key)
+        if not transient or stale is None:
+            return result
+        fetched_at, body = stale
+        if isinstance(body, dict):
+            body = dict(body)
+            body["_stale_since"] = fetched_at
+        return True, body
+
+    def _perform_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        expected: Tuple[int, ...],
+        params: Optional[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]],
+        raw_ok: bool,
+        idempotent: Optional[bool],
+        deadline: Optional[float],
+        projection: Optional[Callable[[Dict[str, Any]], Any]],
+        cache_key: Optional[Tuple[str, Tuple]],
+        cond_headers: Optional[Dict[str, str]],
+    ) -> Tuple[bool, Any]:
+        """Bulkhead gate around the network half of ``_request``."""
+        if not self._bulkhead.acquire(timeout=2):
             return False, {
-                "error": "timeout",
-                "detail": "Request to IONOS API timed out.",
+                "error": "bulkhead_full",
+                "detail": (
+                    "Too many in-flight IONOS calls; backend concurrency "
+                    "is capped by IONOS_MAX_INFLIGHT. Try again shortly."
+                ),
             }
-        except requests.exceptions.ConnectionError:
+        self.inflight_calls += 1
+        try:
+            return self._issue_request(
+                method,
+                path,
+                expected=expected,
+                params=params,
+                json_body=json_body,
+                raw_ok=raw_ok,
+                idempotent=idempotent,
+                deadline=deadline,
+                projection=projection,
+                cache_key=cache_key,
+                cond_headers=cond_headers,
+            )
+        finally:
+            self.inflight_calls -= 1
+            self._bulkhead.release()
+
+    def _issue_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        expected: Tuple[int, ...],
+        params: Optional[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]],
+        raw_ok: bool,
+        idempotent: Optional[bool],
+        deadline: Optional[float],
+        projection: Optional[Callable[[Dict[str, Any]], Any]],
+        cache_key: Optional[Tuple[str, Tuple]],
+        cond_headers: Optional[Dict[str, str]],
+    ) -> Tuple[bool, Any]:
+        """Network half of ``_request``: breaker, retries and body handling."""
+        if not self._breaker.allow():
             return False, {
-                "error": "connection_error",
-                "detail": "Unable to reach IONOS API endpoint.",
+                "error": "circuit_open",
+                "detail": (
+                    "IONOS API has failed repeatedly; skipping this call "
+                    "until the circuit breaker's cool-down passes."
+                ),
             }
-        except Exception as exc:
-            return False, {"error": "unexpected_error", "detail": str(exc)}
 
+        url = self._base + path.lstrip("/")
+
+        # Serialize the body once up front (orjson when available) so each
+        # retry re-sends the same bytes instead of re-encoding the dict.
+        # Content-Type is already fixed on the session headers.
+        data = None
+        if json_body is not None:
+            if orjson is not None:
+                data = orjson.dumps(json_body)
+            else:
+                data = json.dumps(json_body).encode("utf-8")
+
+        # Bounded full-jitter backoff on transient failures: a stray 429 or
+        # 503 mid-flow costs a short sleep instead of aborting a pipeline
+        # that has already provisioned resources. Non-idempotent POSTs only
+        # retry statuses the server rejects before acting (429/503).
+        if idempotent is None:
+            idempotent = method.lower() != "post"
+        retry_statuses = _RETRY_STATUSES if idempotent else _POST_RETRY_STATUSES
+
+        for attempt in range(_RETRY_MAX_ATTEMPTS):
+            # A composite flow shares one deadline across all of its calls;
+            # each request (and each retry) only gets what is left of it.
+            timeout: float = self._timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False, {
+                        "error": "timeout",
+                        "detail": "Flow deadline exhausted before the request was sent.",
+                    }
+                timeout = max(0.1, min(self._timeout, remaining))
+
+            transient_error = None
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    headers=cond_headers,
+                    timeout=timeout,
+                    stream=raw_ok or projection is not None,
+                )
+            except requests.exceptions.Timeout:
+                response = None
+                transient_error = {
+                    "error": "timeout",
+                    "detail": "Request to IONOS API timed out.",
+                }
+            except requests.exceptions.ConnectionError:
+                response = None
+                transient_error = {
+                    "error": "connection_error",
+                    "detail": "Unable to reach IONOS API endpoint.",
+                }
+            except Exception as exc:
+                return False, {"error": "unexpected_error", "detail": str(exc)}
+
+            last_attempt = attempt == _RETRY_MAX_ATTEMPTS - 1
+            if response is None:
+                if not idempotent or last_attempt:
+                    self._breaker.record_failure()
+                    return False, transient_error
+                delay = random.uniform(
+                    0, min(_RETRY_CAP, _RETRY_BASE * 2**attempt)
+                )
+            elif response.status_code in retry_statuses and not last_attempt:
+                # Prefer the server's own pacing hint when it gives one.
+                delay = None
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = min(_RETRY_CAP, float(retry_after))
+                    except ValueError:
+                        pass
+                if delay is None:
+                    delay = random.uniform(
+                        0, min(_RETRY_CAP, _RETRY_BASE * 2**attempt)
+                    )
+                response.close()
+            else:
+                break
+            time.sleep(delay)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+
+        if response.status_code == 304 and cache_key is not None:
+            with self._cache_lock:
+                if cache_key in self._body_cache:
+                    result = (True, self._body_cache[cache_key])
+                    if self._get_cache is not None:
+                        self._get_cache[cache_key] = result
+                    return result
+
+        body_of = self._bounded_body if raw_ok else self._response_body
         if response.status_code not in expected:
             return False, {
                 "error": f"http_{response.status_code}",
-                "detail": self._response_body(response),
-                "headers": dict(response.headers),
+                "detail": body_of(response),
+                "headers": _error_headers(response.headers),
             }
 
-        return True, self._response_body(response)
+        if projection is not None:
+            return self._project_items(response, projection)
+
+        result = (True, body_of(response))
+        if cache_key is not None:
+            with self._cache_lock:
+                self._lkg[cache_key] = (time.time(), result[1])
+                _evict_oldest(self._lkg)
+                if self._get_cache is not None:
+                    self._get_cache[cache_key] = result
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag[cache_key] = etag
+                    self._body_cache[cache_key] = result[1]
+                    _evict_oldest(self._etag)
+                    _evict_oldest(self._body_cache)
+        elif method.lower() != "get":
+            # Any successful mutation may change what the list endpoints
+            # return (including the depth=5 datacenter dumps), so drop the
+            # whole cached window rather than guessing affected prefixes.
+            self.invalidate_cache()
+        return result
+
+    def _cached_get(
+        self,
+        path: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[bool, Any]:
+        """GET with an on-disk TTL tier that survives process restarts."""
+        if _DISK_CACHE is None:
+            return self._request("get", path, params=params, deadline=deadline)
+        key = (path, tuple(sorted((params or {}).items())))
+        hit = _DISK_CACHE.get(key)
+        if hit is not None:
+            return hit
+        result = self._request("get", path, params=params, deadline=deadline)
+        if result[0]:
+            _DISK_CACHE.set(key, result, expire=ttl)
+        return result
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached GET responses whose path starts with ``prefix``."""
+        if self._get_cache is not None:
+            with self._cache_lock:
+                if not prefix:
+                    self._get_cache.clear()
+                else:
+                    for key in [
+                        k for k in self._get_cache if k[0].startswith(prefix)
+                    ]:
+                        self._get_cache.pop(key, None)
+        if _DISK_CACHE is not None:
+            try:
+                if not prefix:
+                    _DISK_CACHE.clear()
+                else:
+                    for key in list(_DISK_CACHE):
+                        if key[0].startswith(prefix):
+                            _DISK_CACHE.pop(key, None)
+            except Exception:
+                pass
+        # The HTTP-level tier (requests_cache) must not outlive mutations
+        # either; its keys are hashed URLs, so drop it wholesale rather
+        # than guessing which entries a prefix maps to.
+        http_cache = getattr(self.session, "cache", None)
+        if http_cache is not None:
+            try:
+                http_cache.clear()
+            except Exception:
+                pass
 
     @staticmethod
     def _response_body(response: Any) -> Any:
@@ -125,14 +823,71 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             text = (getattr(response, "text", "") or "").strip()
             return text[:600] + ("..." if len(text) > 600 else "")
 
+    @staticmethod
+    def _bounded_body(response: Any) -> Any:
+        """Read at most 8 KiB of a streamed body.
+
+        Callers opting in via ``raw_ok`` only ever hand the result to
+        ``_stringify`` (which truncates to 600 chars), so parsing a
+        multi-hundred-KB body in full would be wasted work. If the slice
+        happens to be complete JSON it is parsed; otherwise the truncated
+        text is returned as-is.
+        """
+        try:
+            chunk = response.raw.read(8192, decode_content=True)
+        finally:
+            response.close()
+        try:
+            if orjson is not None:
+                return orjson.loads(chunk)
+            return json.loads(chunk)
+        except ValueError:
+            text = chunk.decode("utf-8", "replace").strip()
+            return text[:600] + ("..." if len(text) > 600 else "")
+
+    def _project_items(
+        self, response: Any, projection: Callable[[Dict[str, Any]], Any]
+    ) -> Tuple[bool, Any]:
+        """Project each entry of a collection response without a full DOM.
+
+        With ijson installed the body is parsed incrementally, so only one
+        item dict is materialised at a time even for deep listings whose
+        nested entities the projection discards. Without it, fall back to
+        the buffered parse. Returns ``(True, rows)`` or, when the body is
+        not the expected JSON, ``(False, error_dict)`` so callers keep the
+        usual ``_request`` contract instead of seeing a raised parse error.
+        """
+        if ijson is not None:
+            try:
+                response.raw.decode_content = True
+                return True, [
+                    projection(item)
+                    for item in ijson.items(response.raw, "items.item")
+                ]
+            except (ijson.JSONError, ValueError) as exc:
+                return False, {"error": "parse_error", "detail": str(exc)}
+            finally:
+                response.close()
+        body = self._response_body(response)
+        if not isinstance(body, dict):
+            return False, {"error": "parse_error", "detail": body}
+        return True, [projection(item) for item in body.get("items", [])]
+
     @staticmethod
     def _stringify(value: Any, limit: int = 600) -> str:
         if value is None:
             return "n/a"
         if isinstance(value, str):
             text = value.strip()
+        elif orjson is not None:
+            try:
+                text = orjson.dumps(value, option=orjson.OPT_INDENT_2).decode(
+                    "utf-8", "replace"
+                )
+            except TypeError:
+                text = json.dumps(value, ensure_ascii=True, indent=2, default=str)
         else:
-            text = json.dumps(value, ensure_ascii=True, indent=2)
+            text = json.dumps(value, ensure_ascii=True, indent=2, default=str)
         return text[:limit] + ("..." if len(text) > limit else "")
 
     def _format_error(self, action: str, detail: Any) -> str:
@@ -153,15 +908,39 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     # datacenter operations
     # ------------------------------------------------------------------
     def list_datacenters(self, detailed: bool = False) -> str:
-        ok, data = self._request("get", "datacenters", params={"depth": 5})
+        # The summary view only renders id/name/location/description, so
+        # depth=1 keeps the payload small; the detailed view asks for the
+        # full depth=5 tree once and renders inventory from its `entities`
+        # instead of issuing five follow-up GETs per datacenter.
+        params = _DEPTH5 if detailed else {"depth": 1}
+        # Read-only view: fall back to the last-known-good snapshot (with
+        # a staleness banner) when IONOS is transiently unreachable.
+        ok, data = self._request("get", "datacenters", params=params, allow_stale=True)
         if not ok:
             return self._format_error("listing datacenters", data)
+        stale_since = data.pop("_stale_since", None) if isinstance(data, dict) else None
+
+        # IP blocks are account-level, not nested under a datacenter, so
+        # fetch them once up front for the detailed view; they change
+        # rarely, so the on-disk tier is allowed to serve them.
+        ipblocks = None
+        if detailed:
+            ipb_ok, ipb = self._cached_get("ipblocks", ttl=30, params={"depth": 1})
+            ipblocks = ipb if ipb_ok else None
 
         items = data.get("items", [])
         if not items:
             return "⚠️  No datacenters found."
 
         lines = ["🏢 **IONOS Cloud Datacenters:**"]
+        if stale_since is not None:
+            fetched = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(stale_since)
+            )
+            lines.insert(
+                0,
+                f"⚠️  Stale data from {fetched} — IONOS API is currently unavailable.",
+            )
         for dc in items:
             dc_id = dc.get("id")
             props = dc.get("properties", {}) or {}
@@ -173,89 +952,101 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             if desc:
                 lines.append(f"   • Description: {desc}")
             if detailed:
-                lines.extend(self._fetch_full_inventory(dc_id))
+                lines.extend(self._fetch_full_inventory(dc, ipblocks))
         return "\n".join(lines)
 
-    def _fetch_full_inventory(self, datacenter_id: str) -> list[str]:
-        """Return human-friendly overview of all key sub-components."""
+    def _fetch_full_inventory(
+        self,
+        datacenter: Dict[str, Any],
+        ipblocks: Optional[Dict[str, Any]] = None,
+    ) -> list[str]:
+        """Render an overview of key sub-components from a depth=5 node.
+
+        The depth=5 datacenter listing already embeds servers, volumes,
+        LANs and load balancers under ``entities``, so this walks the tree
+        the caller already holds instead of issuing follow-up GETs. The
+        account-level IP blocks are fetched once by the caller.
+        """
         sections = []
+        entities = datacenter.get("entities") or {}
 
-        def safe(val, fallback="<unknown>"):
-            return val if val not in (None, "", "None") else fallback
+        # Each section extracts its columns once into parallel lists, then
+        # emits all lines with a single comprehension — one f-string per
+        # item instead of repeated dict lookups and appends in the loop.
 
         # --- Servers ---
-        ok, srv = self._request(
-            "get", f"datacenters/{datacenter_id}/servers", params={"depth": 5}
-        )
-        if ok and srv.get("items"):
+        srv = entities.get("servers") or {}
+        if srv.get("items"):
+            props = [s.get("properties") or {} for s in srv["items"]]
+            names = [_safe(p.get("name"), "<no name>") for p in props]
+            cores = [_safe(p.get("cores"), "?") for p in props]
+            rams = [_safe(p.get("ram"), "?") for p in props]
+            states = [_safe(p.get("vmState"), "n/a") for p in props]
             sections.append("   🔹 Servers:")
-            for s in srv["items"]:
-                p = s.get("properties", {}) or {}
-                power = safe(p.get("vmState"), "n/a")
-                state_emoji = {"RUNNING": "🟢", "STOPPED": "🔴", "BUSY": "🟡"}.get(
-                    power, "⚪"
-                )
-                sections.append(
-                    f"      - {state_emoji} {safe(p.get('name'), '<no name>')} "
-                    f"(Cores {safe(p.get('cores'),'?')}, RAM {safe(p.get('ram'),'?')} MB, State {power})"
-                )
+            sections.extend(
+                f"      - {_VM_STATE_EMOJI.get(st, '⚪')} {n} (Cores {c}, RAM {r} MB, State {st})"
+                for n, c, r, st in zip(names, cores, rams, states)
+            )
         else:
             sections.append("   🔹 No servers found.")
 
         # --- Volumes ---
-        ok, vol = self._request(
-            "get", f"datacenters/{datacenter_id}/volumes", params={"depth": 5}
-        )
-        if ok and vol.get("items"):
+        vol = entities.get("volumes") or {}
+        if vol.get("items"):
+            props = [v.get("properties") or {} for v in vol["items"]]
+            names = [_safe(p.get("name"), "<no name>") for p in props]
+            sizes = [_safe(p.get("size"), "?") for p in props]
+            types = [_safe(p.get("type"), "?") for p in props]
             sections.append("   💽 Volumes:")
-            for v in vol["items"]:
-                p = v.get("properties", {}) or {}
-                sections.append(
-                    f"      - {safe(p.get('name'), '<no name>')} "
-                    f"({safe(p.get('size'), '?')} GB, Type: {safe(p.get('type'), '?')})"
-                )
+            sections.extend(
+                f"      - {n} ({s} GB, Type: {t})"
+                for n, s, t in zip(names, sizes, types)
+            )
         else:
             sections.append("   💽 No volumes found.")
 
         # --- LANs ---
-        ok, lan = self._request(
-            "get", f"datacenters/{datacenter_id}/lans", params={"depth": 5}
-        )
-        if ok and lan.get("items"):
+        lan = entities.get("lans") or {}
+        if lan.get("items"):
+            rows = lan["items"]
+            ids = [l.get("id") for l in rows]
+            kinds = [
+                _LAN_PUBLIC if (l.get("properties") or {}).get("public") else _LAN_PRIVATE
+                for l in rows
+            ]
+            nic_counts = [
+                len(l.get("entities", {}).get("nics", {}).get("items", []))
+                for l in rows
+            ]
             sections.append("   🌐 LANs:")
-            for l in lan["items"]:
-                p = l.get("properties", {}) or {}
-                lan_type = "Public 🌍" if p.get("public") else "Private 🔒"
-                attached = len(l.get("entities", {}).get("nics", {}).get("items", []))
-                sections.append(
-                    f"      - LAN {l.get('id')} ({lan_type}, {attached} attached NICs)"
-                )
+            sections.extend(
+                f"      - LAN {i} ({k}, {n} attached NICs)"
+                for i, k, n in zip(ids, kinds, nic_counts)
+            )
         else:
             sections.append("   🌐 No LANs found.")
 
         # --- IP Blocks ---
-        ok, ipb = self._request("get", "ipblocks", params={"depth": 1})
-        if ok and ipb.get("items"):
+        ipb = ipblocks or {}
+        if ipb.get("items"):
+            props = [i.get("properties") or {} for i in ipb["items"]]
+            names = [_safe(p.get("name"), "<no name>") for p in props]
+            ips = [", ".join(p.get("ips", [])) for p in props]
             sections.append("   🌍 IP Blocks:")
-            for i in ipb["items"]:
-                p = i.get("properties", {}) or {}
-                sections.append(
-                    f"      - {safe(p.get('name'), '<no name>')} [{', '.join(p.get('ips', []))}]"
-                )
+            sections.extend(f"      - {n} [{i}]" for n, i in zip(names, ips))
         else:
             sections.append("   🌍 No IP blocks found.")
 
         # --- Load Balancers ---
-        ok, lbs = self._request(
-            "get", f"datacenters/{datacenter_id}/loadbalancers", params={"depth": 5}
-        )
-        if ok and lbs.get("items"):
+        lbs = entities.get("loadbalancers") or {}
+        if lbs.get("items"):
+            props = [lb.get("properties") or {} for lb in lbs["items"]]
+            names = [_safe(p.get("name"), "<no name>") for p in props]
+            algos = [_safe(p.get("lbAlgorithm"), "?") for p in props]
             sections.append("   ⚖️  Load Balancers:")
-            for lb in lbs["items"]:
-                p = lb.get("properties", {}) or {}
-                sections.append(
-                    f"      - {safe(p.get('name'), '<no name>')} (Algo: {safe(p.get('lbAlgorithm'),'?')})"
-                )
+            sections.extend(
+                f"      - {n} (Algo: {a})" for n, a in zip(names, algos)
+            )
         else:
             sections.append("   ⚖️  No load balancers found.")
 
@@ -264,7 +1055,13 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     # ------------------------------------------------------------------
     # create datacenter
     # ------------------------------------------------------------------
-    def create_datacenter(self, name: str, location: str, description: str = "") -> str:
+    def create_datacenter(
+        self,
+        name: str,
+        location: str,
+        description: str = "",
+        verbose: bool = False,
+    ) -> str:
         payload = {
             "properties": {
                 "name": name,
@@ -277,10 +1074,14 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             "datacenters",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
         )
         if not ok:
             return self._format_error("creating datacenter", data)
-        return "Datacenter creation requested.\n" + self._stringify(data)
+        if verbose:
+            return "Datacenter creation requested.\n" + self._stringify(data)
+        dc_id = data.get("id", "?") if isinstance(data, dict) else "?"
+        return f"Datacenter creation requested. id={dc_id}"
 
     # ------------------------------------------------------------------
     # delete datacenter
@@ -300,20 +1101,33 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     # server operations
     # ------------------------------------------------------------------
     def list_servers(self, datacenter_id: str) -> str:
-        ok, data = self._request("get", f"datacenters/{datacenter_id}/servers")
+        # Only four fields per server are rendered, so project each item
+        # into a tuple while the body streams past instead of buffering
+        # the full nested response. Trade-off: projected GETs skip the
+        # TTL/ETag memo (the key cannot capture the callable), so repeat
+        # calls within the cache window re-fetch — acceptable here since
+        # the streamed body is cheap and vmState goes stale quickly anyway.
+        ok, rows = self._request(
+            "get",
+            f"datacenters/{datacenter_id}/servers",
+            projection=lambda it: (
+                it.get("id"),
+                it.get("properties", {}).get("name"),
+                it.get("properties", {}).get("cores"),
+                it.get("properties", {}).get("vmState"),
+            ),
+        )
         if not ok:
-            return self._format_error(f"listing servers in {datacenter_id}", data)
+            return self._format_error(f"listing servers in {datacenter_id}", rows)
 
-        items = data.get("items", []) if isinstance(data, dict) else []
-        if not items:
+        if not rows:
             return f"No servers found in datacenter {datacenter_id}."
 
         lines = [f"Servers in {datacenter_id}:"]
-        for item in items:
-            props = item.get("properties", {})
-            lines.append(
-                f"- {item.get('id')} | name: {props.get('name')} | cores: {props.get('cores')} | state: {props.get('vmState')}"
-            )
+        lines.extend(
+            f"- {server_id} | name: {name} | cores: {cores} | state: {state}"
+            for server_id, name, cores, state in rows
+        )
         return "\n".join(lines)
 
     def create_basic_server(
@@ -323,6 +1137,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         cores: int = 2,
         ram_mb: int = 4096,
         availability_zone: str = "AUTO",
+        verbose: bool = False,
     ) -> str:
         payload = {
             "properties": {
@@ -337,10 +1152,14 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/servers",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
         )
         if not ok:
             return self._format_error("creating server", data)
-        return "Server creation requested.\n" + self._stringify(data)
+        if verbose:
+            return "Server creation requested.\n" + self._stringify(data)
+        server_id = data.get("id", "?") if isinstance(data, dict) else "?"
+        return f"Server creation requested. id={server_id}"
 
     def set_server_power_state(
         self,
@@ -356,6 +1175,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             "post",
             f"datacenters/{datacenter_id}/servers/{server_id}/{action}",
             expected=(202,),
+            raw_ok=True,
         )
         if not ok:
             return self._format_error(
@@ -385,6 +1205,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/lans",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
         )
         if not ok:
             return self._format_error("creating LAN", data)
@@ -416,6 +1237,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/volumes",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
         )
         if not ok:
             return self._format_error("creating volume", data)
@@ -428,7 +1250,9 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     def create_ipblock(self, name: str, location: str, size: int = 1) -> str:
         """Reserve a public IP block."""
         payload = {"properties": {"name": name, "location": location, "size": size}}
-        ok, data = self._request("post", "ipblocks", expected=(202,), json_body=payload)
+        ok, data = self._request(
+            "post", "ipblocks", expected=(202,), json_body=payload, raw_ok=True
+        )
         if not ok:
             return self._format_error("creating IP block", data)
         return f"🌍 IP block reservation requested: {name} ({size} IPs at {location})"
@@ -451,6 +1275,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/loadbalancers",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
         )
         if not ok:
             return self._format_error("creating load balancer", data)
@@ -488,7 +1313,12 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     # ------------------------------------------------------------------
     # CREATE A INTERNET ACCESS FOR A LAN
     # ------------------------------------------------------------------
-    def create_internet_access(self, datacenter_id: str, lan_id: int) -> str:
+    def create_internet_access(
+        self,
+        datacenter_id: str,
+        lan_id: int,
+        deadline: Optional[float] = None,
+    ) -> str:
         """
         Enable Internet access on a LAN — this provides outbound connectivity.
         """
@@ -498,6 +1328,8 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/internet-accesses",
             expected=(202,),
             json_body=payload,
+            raw_ok=True,
+            deadline=deadline,
         )
         if not ok:
             return self._format_error("enabling Internet access", data)
@@ -514,6 +1346,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         nic_id: str,
         rules: list[dict],
         replace_existing: bool = False,
+        deadline: Optional[float] = None,
     ) -> str:
         """
         Create or replace firewall rules for a NIC.
@@ -533,16 +1366,28 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
                 "delete",
                 f"datacenters/{datacenter_id}/servers/{server_id}/nics/{nic_id}/firewallrules",
                 expected=(202, 204),
+                deadline=deadline,
             )
 
-        results = []
-        for rule in rules:
-            ok, data = self._request(
+        # Rules are independent POSTs, so fan them out over the shared
+        # executor; results are reported in the caller's original order.
+        path = f"datacenters/{datacenter_id}/servers/{server_id}/nics/{nic_id}/firewallrules"
+        futures = [
+            _EXECUTOR.submit(
+                self._request,
                 "post",
-                f"datacenters/{datacenter_id}/servers/{server_id}/nics/{nic_id}/firewallrules",
+                path,
                 expected=(202,),
                 json_body={"properties": rule},
+                raw_ok=True,
+                deadline=deadline,
             )
+            for rule in rules
+        ]
+
+        results = []
+        for rule, future in zip(rules, futures):
+            ok, data = future.result()
             if not ok:
                 results.append(f"❌ Failed to add rule `{rule.get('name')}`: {self._stringify(data)}")
             else:
@@ -573,34 +1418,40 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         """
         summary = [f"🚀 Provisioning server **{name}** in DC {datacenter_id}"]
 
-        # 1. Create LAN
-        lan_resp = self._request(
+        # One budget for the whole flow: each step gets whatever time is
+        # left rather than a fresh 45s, so the flow as a whole cannot run
+        # for minutes when the API is slow.
+        deadline = time.monotonic() + float(os.getenv("IONOS_FLOW_DEADLINE", "90"))
+
+        # The datacenter prefix is shared by every step; format it once.
+        dc = f"datacenters/{datacenter_id}"
+
+        # Only attach/NIC/Internet access depend on earlier IDs; LAN,
+        # server and volume creation are independent, so each stage fires
+        # its requests in parallel and waits before the next. Wall time
+        # drops from seven round-trips to roughly three.
+
+        # Stage 1: LAN + Server + Volume
+        lan_f = _EXECUTOR.submit(
+            self._request,
             "post",
-            f"datacenters/{datacenter_id}/lans",
+            f"{dc}/lans",
             expected=(202,),
             json_body={"properties": {"name": lan_name, "public": False}},
+            deadline=deadline,
         )
-        if not lan_resp[0]:
-            return self._format_error("creating LAN", lan_resp[1])
-        lan_id = lan_resp[1].get("id")
-        summary.append(f"🌐 LAN created: {lan_name} (id={lan_id})")
-
-        # 2. Create Server
-        srv_resp = self._request(
+        srv_f = _EXECUTOR.submit(
+            self._request,
             "post",
-            f"datacenters/{datacenter_id}/servers",
+            f"{dc}/servers",
             expected=(202,),
             json_body={"properties": {"name": name, "cores": 2, "ram": 4096}},
+            deadline=deadline,
         )
-        if not srv_resp[0]:
-            return self._format_error("creating server", srv_resp[1])
-        server_id = srv_resp[1].get("id")
-        summary.append(f"🖥️  Server created: {name} (id={server_id})")
-
-        # 3. Create Volume + attach
-        vol_resp = self._request(
+        vol_f = _EXECUTOR.submit(
+            self._request,
             "post",
-            f"datacenters/{datacenter_id}/volumes",
+            f"{dc}/volumes",
             expected=(202,),
             json_body={
                 "properties": {
@@ -610,36 +1461,63 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
                     "licenceType": "LINUX",
                 }
             },
+            deadline=deadline,
         )
+
+        lan_resp = lan_f.result()
+        srv_resp = srv_f.result()
+        vol_resp = vol_f.result()
+        if not lan_resp[0]:
+            return self._format_error("creating LAN", lan_resp[1])
+        lan_id = lan_resp[1].get("id")
+        summary.append(f"🌐 LAN created: {lan_name} (id={lan_id})")
+        if not srv_resp[0]:
+            return self._format_error("creating server", srv_resp[1])
+        server_id = srv_resp[1].get("id")
+        summary.append(f"🖥️  Server created: {name} (id={server_id})")
         if not vol_resp[0]:
             return self._format_error("creating volume", vol_resp[1])
         volume_id = vol_resp[1].get("id")
         summary.append(f"💽 Volume created: {name}-disk ({volume_size_gb} GB)")
 
-        self.attach_volume_to_server(datacenter_id, server_id, volume_id)
-
-        # 4. Create NIC on LAN
-        nic_resp = self._request(
+        # Stage 2: attach volume, add NIC, enable Internet access
+        attach_f = _EXECUTOR.submit(
+            self.attach_volume_to_server,
+            datacenter_id,
+            server_id,
+            volume_id,
+            deadline=deadline,
+        )
+        nic_f = _EXECUTOR.submit(
+            self._request,
             "post",
-            f"datacenters/{datacenter_id}/servers/{server_id}/nics",
+            f"{dc}/servers/{server_id}/nics",
             expected=(202,),
             json_body={"properties": {"name": "nic0", "lan": int(lan_id), "dhcp": True}},
+            deadline=deadline,
         )
+        net_f = _EXECUTOR.submit(
+            self.create_internet_access, datacenter_id, int(lan_id), deadline=deadline
+        )
+
+        attach_f.result()
+        nic_resp = nic_f.result()
         if not nic_resp[0]:
             return self._format_error("creating NIC", nic_resp[1])
         nic_id = nic_resp[1].get("id")
         summary.append(f"🧩 NIC added (id={nic_id})")
-
-        # 5. Enable Internet access for LAN
-        self.create_internet_access(datacenter_id, int(lan_id))
+        net_f.result()
         summary.append(f"🌍 Internet access enabled for LAN {lan_id}")
 
-        # 6. Firewall rules
+        # 6. Firewall rules — hoist the invariant fields out of the loop
+        fw_rule_base = {"protocol": "TCP", "sourceIp": "0.0.0.0/0"}
         fw_rules = [
-            {"name": f"allow-{p}", "protocol": "TCP", "portRangeStart": p, "portRangeEnd": p, "sourceIp": "0.0.0.0/0"}
+            {**fw_rule_base, "name": f"allow-{p}", "portRangeStart": p, "portRangeEnd": p}
             for p in firewall_open_ports
         ]
-        self.set_firewall_rules(datacenter_id, server_id, nic_id, fw_rules)
+        self.set_firewall_rules(
+            datacenter_id, server_id, nic_id, fw_rules, deadline=deadline
+        )
         summary.append(f"🛡️  Firewall configured for ports: {firewall_open_ports}")
 
         return "\n".join(summary)
@@ -652,6 +1530,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         datacenter_id: str,
         server_id: str,
         volume_id: str,
+        deadline: Optional[float] = None,
     ) -> str:
         """
         Attach an existing volume to a server.
@@ -668,6 +1547,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             f"datacenters/{datacenter_id}/servers/{server_id}/volumes",
             expected=(202,),
             json_body=payload,
+            deadline=deadline,
         )
         if not ok:
             return self._format_error("attaching volume", data)
@@ -686,12 +1566,18 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
     # ------------------------------------------------------------------
     # SERVER POWER CONTROL
     # ------------------------------------------------------------------
-    def power_on_server(self, datacenter_id: str, server_id: str) -> str:
+    def power_on_server(
+        self,
+        datacenter_id: str,
+        server_id: str,
+        deadline: Optional[float] = None,
+    ) -> str:
         """Start the given server."""
         ok, data = self._request(
             "post",
             f"datacenters/{datacenter_id}/servers/{server_id}/start",
             expected=(202,),
+            deadline=deadline,
         )
         if not ok:
             return self._format_error("powering on server", data)
@@ -741,14 +1627,22 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         "sourceIp": "0.0.0.0/0"
         }
         """
-        results = []
-        for rule in rules:
-            ok, data = self._request(
+        # Independent POSTs: dispatch them all at once and rely on map's
+        # ordering contract to report results in the caller's rule order.
+        path = f"datacenters/{datacenter_id}/servers/{server_id}/nics/{nic_id}/firewallrules"
+        outcomes = _EXECUTOR.map(
+            lambda rule: self._request(
                 "post",
-                f"datacenters/{datacenter_id}/servers/{server_id}/nics/{nic_id}/firewallrules",
+                path,
                 expected=(202,),
                 json_body={"properties": rule},
-            )
+                raw_ok=True,
+            ),
+            rules,
+        )
+
+        results = []
+        for rule, (ok, data) in zip(rules, outcomes):
             if not ok:
                 results.append(f"❌ {rule.get('name')} → {self._stringify(data)}")
             else:
@@ -773,6 +1667,85 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         return f"📏 Resize requested for volume `{volume_id}` → {new_size_gb} GB."
 
 
+    @staticmethod
+    def _validate_server_spec(
+        cores: int,
+        ram_mb: int,
+        volume_size_gb: int,
+        image_alias: str,
+        lan_name: str,
+    ) -> Optional[str]:
+        """Return a human-readable problem with the spec, or None if it is sane.
+
+        A malformed value would otherwise only surface as a 422 from IONOS
+        after the LAN step has already mutated the datacenter, leaving
+        orphan resources behind.
+        """
+        if not 1 <= cores <= 62:
+            return f"cores must be between 1 and 62, got {cores}."
+        if not 256 <= ram_mb <= 262144 or ram_mb % 256 != 0:
+            return f"ram_mb must be a multiple of 256 between 256 and 262144, got {ram_mb}."
+        if volume_size_gb < 10:
+            return f"volume_size_gb must be at least 10, got {volume_size_gb}."
+        if not _IMAGE_ALIAS_RE.match(image_alias or ""):
+            return f"image_alias {image_alias!r} does not look like '<distro>:<version>' (e.g. ubuntu:22.04)."
+        if not _LAN_NAME_RE.match(lan_name or ""):
+            return f"lan_name {lan_name!r} must be 1-63 word characters, dots, dashes or spaces."
+        return None
+
+    def _ensure_lan(
+        self,
+        datacenter_id: str,
+        name: str,
+        public: bool,
+        deadline: Optional[float] = None,
+    ) -> Tuple[Optional[str], str]:
+        """Create the named LAN, falling back to a lookup if it already exists.
+
+        Greenfield provisioning is the common case, so POST first and pay
+        the extra listing round-trip only when the API rejects the name as
+        a duplicate — one round-trip instead of the old list-then-create
+        pair. Returns ``(lan_id, summary_line)``; ``lan_id`` is None on
+        failure and the second element is then a formatted error.
+        """
+        ok, created = self._request(
+            "post",
+            f"datacenters/{datacenter_id}/lans",
+            expected=(202,),
+            json_body={"properties": {"name": name, "public": public}},
+            deadline=deadline,
+        )
+        if ok:
+            lan_id = created.get("id")
+            return lan_id, f"🌐 Created LAN: {name} (id={lan_id})"
+
+        error = created.get("error") if isinstance(created, dict) else None
+        if error not in ("http_409", "http_422"):
+            return None, self._format_error("creating LAN", created)
+
+        # Duplicate name: find the existing LAN. depth=1 is enough since
+        # only id + properties.name are consulted, and the disk tier keeps
+        # the listing warm across short-lived tool processes.
+        ok, lans = self._cached_get(
+            f"datacenters/{datacenter_id}/lans",
+            ttl=10,
+            params={"depth": 1},
+            deadline=deadline,
+        )
+        if not ok:
+            return None, self._format_error("retrieving LANs", lans)
+        existing = next(
+            (
+                lan
+                for lan in lans.get("items", [])
+                if lan.get("properties", {}).get("name") == name
+            ),
+            None,
+        )
+        if existing is None:
+            return None, self._format_error("creating LAN", created)
+        return existing["id"], f"🌐 Using existing LAN: {name} (id={existing['id']})"
+
     # ------------------------------------------------------------------
     # CREATE BOOTABLE SERVER (AUTO SSH KEY)
     # ------------------------------------------------------------------
@@ -797,68 +1770,45 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         - Power-on (optional)
         """
 
+        problem = self._validate_server_spec(
+            cores, ram_mb, volume_size_gb, image_alias, lan_name
+        )
+        if problem:
+            return self._format_error(
+                "validating server spec", {"error": "invalid_spec", "detail": problem}
+            )
+
         summary = [f"🚀 Creating bootable Ubuntu server **{name}**"]
 
-        # --- Step 1: Ensure LAN exists ---
-        ok, lans = self._request("get", f"datacenters/{datacenter_id}/lans", params={"depth": 2})
-        if not ok:
-            return self._format_error("retrieving LANs", lans)
+        # Single budget for the whole flow; see provision_server_with_network.
+        deadline = time.monotonic() + float(os.getenv("IONOS_FLOW_DEADLINE", "90"))
 
-        existing_lan = next((l for l in lans.get("items", []) if l["properties"].get("name") == lan_name), None)
-        if existing_lan:
-            lan_id = existing_lan["id"]
-            summary.append(f"🌐 Using existing LAN: {lan_name} (id={lan_id})")
-        else:
-            ok, newlan = self._request(
-                "post",
-                f"datacenters/{datacenter_id}/lans",
-                expected=(202,),
-                json_body={"properties": {"name": lan_name, "public": public}},
-            )
-            if not ok:
-                return self._format_error("creating LAN", newlan)
-            lan_id = newlan.get("id")
-            summary.append(f"🌐 Created LAN: {lan_name} (id={lan_id})")
+        # --- Step 1: Ensure LAN exists (create-first, lookup on duplicate) ---
+        lan_id, lan_note = self._ensure_lan(
+            datacenter_id, lan_name, public, deadline=deadline
+        )
+        if lan_id is None:
+            return lan_note
+        summary.append(lan_note)
 
         # --- Step 2: Create the bootable server ---
-        payload = {
-            "properties": {
-                "name": name,
-                "cores": cores,
-                "ram": ram_mb,
-                "availabilityZone": "AUTO",
-            },
-            "entities": {
-                "volumes": [
-                    {
-                        "properties": {
-                            "name": f"{name}-boot",
-                            "size": volume_size_gb,
-                            "type": "HDD",
-                            "imageAlias": image_alias,
-                            "licenceType": "LINUX",
-                            "bootVolume": True,
-                            # SSH key omitted → default key used
-                        }
-                    }
-                ],
-                "nics": [
-                    {
-                        "properties": {
-                            "name": "nic0",
-                            "lan": int(lan_id),
-                            "dhcp": True,
-                        }
-                    }
-                ],
-            },
-        }
+        payload = copy.deepcopy(_BOOT_SERVER_SKELETON)
+        props = payload["properties"]
+        props["name"] = name
+        props["cores"] = cores
+        props["ram"] = ram_mb
+        vol_leaf = payload["entities"]["volumes"][0]["properties"]
+        vol_leaf["name"] = f"{name}-boot"
+        vol_leaf["size"] = volume_size_gb
+        vol_leaf["imageAlias"] = image_alias
+        payload["entities"]["nics"][0]["properties"]["lan"] = int(lan_id)
 
         ok, data = self._request(
             "post",
             f"datacenters/{datacenter_id}/servers",
             expected=(202,),
             json_body=payload,
+            deadline=deadline,
         )
         if not ok:
             return self._format_error("creating bootable server", data)
@@ -880,12 +1830,12 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
 
         # --- Step 3: Enable Internet access if requested ---
         if public:
-            self.create_internet_access(datacenter_id, int(lan_id))
+            self.create_internet_access(datacenter_id, int(lan_id), deadline=deadline)
             summary.append(f"🌍 Internet access enabled for LAN {lan_id}")
 
         # --- Step 4: Power on ---
         if auto_power_on:
-            self.power_on_server(datacenter_id, server_id)
+            self.power_on_server(datacenter_id, server_id, deadline=deadline)
             summary.append(f"🟢 Server powered on.")
 
         summary.append("🔑 Default SSH key(s) from your IONOS account will be used.")
@@ -915,30 +1865,360 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
         - LAN + Internet access automatically configured
         """
 
+        # cores/ram/volume are fixed here; only the caller-supplied alias
+        # and LAN name can be malformed.
+        problem = self._validate_server_spec(4, 4096, 40, image_alias, lan_name)
+        if problem:
+            return self._format_error(
+                "validating server spec", {"error": "invalid_spec", "detail": problem}
+            )
+
         summary = [f"🚀 Creating default Ubuntu server **{name}** in datacenter {datacenter_id}"]
 
-        # Step 1: Ensure LAN exists
-        ok, lans = self._request("get", f"datacenters/{datacenter_id}/lans", params={"depth": 2})
+        # Single budget for the whole flow; see provision_server_with_network.
+        deadline = time.monotonic() + float(os.getenv("IONOS_FLOW_DEADLINE", "90"))
+
+        # Step 1: Ensure LAN exists (create-first, lookup on duplicate)
+        lan_id, lan_note = self._ensure_lan(
+            datacenter_id, lan_name, public, deadline=deadline
+        )
+        if lan_id is None:
+            return lan_note
+        summary.append(lan_note)
+
+        # Step 2: Create bootable server
+        payload = copy.deepcopy(_DEFAULT_SERVER_SKELETON)
+        payload["properties"]["name"] = name
+        vol_leaf = payload["entities"]["volumes"]["items"][0]["properties"]
+        vol_leaf["name"] = f"{name}-boot"
+        vol_leaf["imageAlias"] = image_alias
+        payload["entities"]["nics"]["items"][0]["properties"]["lan"] = int(lan_id)
+
+        ok, data = self._request(
+            "post",
+            f"datacenters/{datacenter_id}/servers",
+            expected=(202,),
+            json_body=payload,
+            deadline=deadline,
+        )
         if not ok:
-            return self._format_error("retrieving LANs", lans)
+            return self._format_error("creating default server", data)
 
-        existing_lan = next((l for l in lans.get("items", []) if l["properties"].get("name") == lan_name), None)
-        if existing_lan:
-            lan_id = existing_lan["id"]
-            summary.append(f"🌐 Using existing LAN: {lan_name} (id={lan_id})")
-        else:
-            ok, newlan = self._request(
+        server_id = data.get("id")
+        summary.append(f"🖥️  Server **{name}** created (id={server_id}) with 4 vCPUs / 4 GB RAM")
+        summary.append("💽 Boot volume: 40 GB HDD (Ubuntu latest)")
+        summary.append("🔑 Default SSH key(s) from your IONOS account will be used")
+
+        # Step 3: Enable Internet access
+        if public:
+            self.create_internet_access(datacenter_id, int(lan_id), deadline=deadline)
+            summary.append(f"🌍 Internet access enabled for LAN {lan_id}")
+
+        # Step 4: Power ON
+        self.power_on_server(datacenter_id, server_id, deadline=deadline)
+        summary.append("🟢 Server powered on and ready to SSH")
+
+        return "\n".join(summary)
+
+
+    # ------------------------------------------------------------------
+    # SET EXISTING VOLUME AS BOOTABLE
+    # ------------------------------------------------------------------
+    def set_boot_volume(
+        self,
+        datacenter_id: str,
+        server_id: str,
+        volume_id: str,
+    ) -> str:
+        """
+        Set an existing attached volume as the boot device for a server.
+
+        Equivalent to:
+        PATCH /datacenters/{dcId}/servers/{serverId}
+        { "properties": { "bootVolume": { "id": "<volumeId>" } } }
+        """
+        payload = {"properties": {"bootVolume": {"id": volume_id}}}
+
+        ok, data = self._request(
+            "patch",
+            f"datacenters/{datacenter_id}/servers/{server_id}",
+            expected=(202,),
+            json_body=payload,
+        )
+        if not ok:
+            return self._format_error("setting boot volume", data)
+
+        return (
+            f"💽 Volume `{volume_id}` has been set as the boot device "
+            f"for server `{server_id}`.\n"
+            f"🔁 You may need to reboot the server for the change to take effect."
+        )
+
+
+def get_tools() -> Tools:
+    """Return the process-wide Tools instance, creating it on first use."""
+    return Tools()
+
+
+class AsyncTools:
+    """
+    Async counterpart to Tools for the provisioning pipelines.
+
+    Independent resource creations (LAN, server, volume) are issued with
+    asyncio.gather so their round trips overlap instead of running back to
+    back; only the steps that consume earlier IDs are sequenced. Flows that
+    do not benefit from concurrency stay on the sync Tools. Requires httpx.
+    """
+
+    # Reuse the sync helpers so both clients format output identically.
+    _response_body = staticmethod(Tools._response_body)
+    _stringify = staticmethod(Tools._stringify)
+    _format_error = Tools._format_error
+
+    def __init__(self, config: Optional[IonosConfig] = None) -> None:
+        if httpx is None:
+            raise RuntimeError("httpx is required for AsyncTools.")
+        self.config = config or _default_config()
+
+        auth = None
+        if self.config.auth is not None:
+            auth = (self.config.auth.username, self.config.auth.password)
+
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        timeout = httpx.Timeout(45.0, connect=10.0)
+        try:
+            # HTTP/2 multiplexes the gathered calls over one socket; needs
+            # the optional h2 extra.
+            self.client = httpx.AsyncClient(
+                base_url=self.config.api_base,
+                headers=self.config.headers(),
+                auth=auth,
+                http2=True,
+                timeout=timeout,
+                limits=limits,
+            )
+        except ImportError:
+            self.client = httpx.AsyncClient(
+                base_url=self.config.api_base,
+                headers=self.config.headers(),
+                auth=auth,
+                timeout=timeout,
+                limits=limits,
+            )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        expected: Tuple[int, ...] = (200,),
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, Any]:
+        try:
+            response = await self.client.request(
+                method,
+                "/" + path.lstrip("/"),
+                params=params,
+                json=json_body,
+            )
+        except httpx.TimeoutException:
+            return False, {
+                "error": "timeout",
+                "detail": "Request to IONOS API timed out.",
+            }
+        except httpx.ConnectError:
+            return False, {
+                "error": "connection_error",
+                "detail": "Unable to reach IONOS API endpoint.",
+            }
+        except httpx.HTTPError as exc:
+            return False, {"error": "unexpected_error", "detail": str(exc)}
+
+        if response.status_code not in expected:
+            return False, {
+                "error": f"http_{response.status_code}",
+                "detail": self._response_body(response),
+                "headers": _error_headers(response.headers),
+            }
+
+        return True, self._response_body(response)
+
+    async def provision_server_with_network(
+        self,
+        datacenter_id: str,
+        name: str,
+        lan_name: str = "default-lan",
+        volume_size_gb: int = 20,
+        firewall_open_ports: list[int] = [22, 80, 443],
+    ) -> str:
+        """Async version of Tools.provision_server_with_network."""
+        summary = [f"🚀 Provisioning server **{name}** in DC {datacenter_id}"]
+
+        # 1. LAN, server and volume do not depend on each other — overlap.
+        lan_resp, srv_resp, vol_resp = await asyncio.gather(
+            self._request(
                 "post",
                 f"datacenters/{datacenter_id}/lans",
                 expected=(202,),
-                json_body={"properties": {"name": lan_name, "public": public}},
+                json_body={"properties": {"name": lan_name, "public": False}},
+            ),
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/servers",
+                expected=(202,),
+                json_body={"properties": {"name": name, "cores": 2, "ram": 4096}},
+            ),
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/volumes",
+                expected=(202,),
+                json_body={
+                    "properties": {
+                        "name": f"{name}-disk",
+                        "size": volume_size_gb,
+                        "type": "HDD",
+                        "licenceType": "LINUX",
+                    }
+                },
+            ),
+        )
+        if not lan_resp[0]:
+            return self._format_error("creating LAN", lan_resp[1])
+        if not srv_resp[0]:
+            return self._format_error("creating server", srv_resp[1])
+        if not vol_resp[0]:
+            return self._format_error("creating volume", vol_resp[1])
+
+        lan_id = lan_resp[1].get("id")
+        server_id = srv_resp[1].get("id")
+        volume_id = vol_resp[1].get("id")
+        summary.append(f"🌐 LAN created: {lan_name} (id={lan_id})")
+        summary.append(f"🖥️  Server created: {name} (id={server_id})")
+        summary.append(f"💽 Volume created: {name}-disk ({volume_size_gb} GB)")
+
+        # 2. Volume attach and NIC creation are independent of each other.
+        attach_resp, nic_resp = await asyncio.gather(
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/servers/{server_id}/volumes",
+                expected=(202,),
+                json_body={"id": volume_id},
+            ),
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/servers/{server_id}/nics",
+                expected=(202,),
+                json_body={
+                    "properties": {"name": "nic0", "lan": int(lan_id), "dhcp": True}
+                },
+            ),
+        )
+        if not nic_resp[0]:
+            return self._format_error("creating NIC", nic_resp[1])
+        nic_id = nic_resp[1].get("id")
+        summary.append(f"🧩 NIC added (id={nic_id})")
+
+        # 3. Internet access and the per-port firewall rules in one gather.
+        fw_base = (
+            f"datacenters/{datacenter_id}/servers/{server_id}"
+            f"/nics/{nic_id}/firewallrules"
+        )
+        await asyncio.gather(
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/internet-accesses",
+                expected=(202,),
+                json_body={"properties": {"lanId": int(lan_id)}},
+            ),
+            *[
+                self._request(
+                    "post",
+                    fw_base,
+                    expected=(202,),
+                    json_body={
+                        "properties": {
+                            "name": f"allow-{p}",
+                            "protocol": "TCP",
+                            "portRangeStart": p,
+                            "portRangeEnd": p,
+                            "sourceIp": "0.0.0.0/0",
+                        }
+                    },
+                )
+                for p in firewall_open_ports
+            ],
+        )
+        summary.append(f"🌍 Internet access enabled for LAN {lan_id}")
+        summary.append(f"🛡️  Firewall configured for ports: {firewall_open_ports}")
+
+        return "\n".join(summary)
+
+    async def create_default_server(
+        self,
+        datacenter_id: str,
+        name: str = "default-ubuntu-server",
+        image_alias: str = "ubuntu:24.04",
+        lan_name: str = "default-lan",
+        public: bool = True,
+    ) -> str:
+        """Async version of Tools.create_default_server.
+
+        The LAN ensure and server creation are inherently sequential (the
+        composite payload embeds the LAN id), but the trailing Internet
+        access and power-on steps only depend on the server, so they run
+        in one gather.
+        """
+        # Same entry validation as the sync flow: cores/ram/volume are
+        # fixed here, so only the caller-supplied alias and LAN name can
+        # be malformed, and a bad value must not reach the LAN POST.
+        problem = Tools._validate_server_spec(4, 4096, 40, image_alias, lan_name)
+        if problem:
+            return self._format_error(
+                "validating server spec", {"error": "invalid_spec", "detail": problem}
             )
-            if not ok:
-                return self._format_error("creating LAN", newlan)
-            lan_id = newlan.get("id")
+
+        summary = [
+            f"🚀 Creating default Ubuntu server **{name}** in datacenter {datacenter_id}"
+        ]
+
+        # Ensure the LAN exists, mirroring Tools._ensure_lan: POST first
+        # (greenfield is the common case), fall back to a depth=1 lookup
+        # only when the API rejects the name as a duplicate.
+        ok, created = await self._request(
+            "post",
+            f"datacenters/{datacenter_id}/lans",
+            expected=(202,),
+            json_body={"properties": {"name": lan_name, "public": public}},
+        )
+        if ok:
+            lan_id = created.get("id")
             summary.append(f"🌐 Created LAN: {lan_name} (id={lan_id})")
+        else:
+            error = created.get("error") if isinstance(created, dict) else None
+            if error not in ("http_409", "http_422"):
+                return self._format_error("creating LAN", created)
+            ok, lans = await self._request(
+                "get", f"datacenters/{datacenter_id}/lans", params={"depth": 1}
+            )
+            if not ok:
+                return self._format_error("retrieving LANs", lans)
+            existing_lan = next(
+                (
+                    lan
+                    for lan in lans.get("items", [])
+                    if lan.get("properties", {}).get("name") == lan_name
+                ),
+                None,
+            )
+            if existing_lan is None:
+                return self._format_error("creating LAN", created)
+            lan_id = existing_lan["id"]
+            summary.append(f"🌐 Using existing LAN: {lan_name} (id={lan_id})")
 
-        # Step 2: Create bootable server
         payload = {
             "properties": {
                 "name": name,
@@ -957,7 +2237,6 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
                                 "imageAlias": image_alias,
                                 "licenceType": "LINUX",
                                 "bootVolume": True,
-                                # SSH key omitted → default used
                             }
                         }
                     ]
@@ -976,8 +2255,7 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             },
         }
 
-
-        ok, data = self._request(
+        ok, data = await self._request(
             "post",
             f"datacenters/{datacenter_id}/servers",
             expected=(202,),
@@ -987,51 +2265,31 @@ class Tools:  # <-- ✅ must be named Tools for OpenWebUI to load it
             return self._format_error("creating default server", data)
 
         server_id = data.get("id")
-        summary.append(f"🖥️  Server **{name}** created (id={server_id}) with 4 vCPUs / 4 GB RAM")
+        summary.append(
+            f"🖥️  Server **{name}** created (id={server_id}) with 4 vCPUs / 4 GB RAM"
+        )
         summary.append("💽 Boot volume: 40 GB HDD (Ubuntu latest)")
         summary.append("🔑 Default SSH key(s) from your IONOS account will be used")
 
-        # Step 3: Enable Internet access
+        finishers = [
+            self._request(
+                "post",
+                f"datacenters/{datacenter_id}/servers/{server_id}/start",
+                expected=(202,),
+            )
+        ]
+        if public:
+            finishers.append(
+                self._request(
+                    "post",
+                    f"datacenters/{datacenter_id}/internet-accesses",
+                    expected=(202,),
+                    json_body={"properties": {"lanId": int(lan_id)}},
+                )
+            )
+        await asyncio.gather(*finishers)
         if public:
-            self.create_internet_access(datacenter_id, int(lan_id))
             summary.append(f"🌍 Internet access enabled for LAN {lan_id}")
-
-        # Step 4: Power ON
-        self.power_on_server(datacenter_id, server_id)
         summary.append("🟢 Server powered on and ready to SSH")
 
         return "\n".join(summary)
-
-
-    # ------------------------------------------------------------------
-    # SET EXISTING VOLUME AS BOOTABLE
-    # ------------------------------------------------------------------
-    def set_boot_volume(
-        self,
-        datacenter_id: str,
-        server_id: str,
-        volume_id: str,
-    ) -> str:
-        """
-        Set an existing attached volume as the boot device for a server.
-
-        Equivalent to:
-        PATCH /datacenters/{dcId}/servers/{serverId}
-        { "properties": { "bootVolume": { "id": "<volumeId>" } } }
-        """
-        payload = {"properties": {"bootVolume": {"id": volume_id}}}
-
-        ok, data = self._request(
-            "patch",
-            f"datacenters/{datacenter_id}/servers/{server_id}",
-            expected=(202,),
-            json_body=payload,
-        )
-        if not ok:
-            return self._format_error("setting boot volume", data)
-
-        return (
-            f"💽 Volume `{volume_id}` has been set as the boot device "
-            f"for server `{server_id}`.\n"
-            f"🔁 You may need to reboot the server for the change to take effect."
-        )